@@ -4,74 +4,194 @@ from __future__ import annotations
 TensorBoard Compression plugin.
 """
 
+import gzip
+import hashlib
 import json
+import logging
+import re
+import threading
+import time
 from typing import Any, Dict
 
 from tensorboard.backend import http_util
+from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
+from tensorboard.plugins.scalar import metadata as scalar_metadata
 from tensorboard import plugin_util
 from werkzeug.wrappers import Request, Response
 
+logger = logging.getLogger(__name__)
 
-class CompressionPlugin(base_plugin.TBPlugin):
-    """TensorBoard plugin that provides a Compression dashboard tab."""
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    plugin_name = "compression"
+try:
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
 
-    def __init__(self, context: base_plugin.TBContext) -> None:
-        super().__init__(context)
-        self._context = context
 
-    def is_active(self) -> bool:
-        """Return True if the plugin should be shown."""
-        try:
-            multiplexer = getattr(self._context, "multiplexer", None)
-            if not multiplexer:
-                return True
-            runs = multiplexer.Runs()
-            if not runs:
-                return True
-            # Check if any run has compression tags by testing a known tag
-            for run_name in runs.keys():
-                try:
-                    # Test if compression/speedup tag exists
-                    events = multiplexer.Scalars(run_name, f"{run_name}/compression/speedup")
-                    if events:
-                        return True
-                except Exception:
-                    continue
-            return True
-        except Exception:
-            return True
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
-    def frontend_metadata(self):
-        """Return frontend metadata."""
-        return base_plugin.FrontendMetadata(
-            # TensorBoard does: "." + es_module_path for import
-            # Iframe loads from /data/plugin_entry.html?name=compression
-            # Base href is "plugin/compression/" but ES modules don't respect <base>
-            # So import("./render.js") resolves to /data/render.js (wrong!)
-            # We need import("./plugin/compression/render.js") to resolve to /data/plugin/compression/render.js
-            # So es_module_path should be "/plugin/compression/render.js"
-            es_module_path="/plugin/compression/render.js",
-            tab_name="COMPRESSION",
-            disable_reload=False,
-        )
 
-    def get_plugin_apps(self) -> Dict[str, Any]:
-        # Return handlers directly - TensorBoard will call them with (environ, start_response).
-        # Routes must start with a slash.
-        return {
-            "/": self._serve_index,
-            "/render.js": self._serve_render_module,
-            "/api/summary": self._serve_summary,
-        }
-    
-    def _serve_render_module(self, environ, start_response):
-        """Serve an ES module that renders our HTML directly."""
-        request = Request(environ)
-        # ES module that renders HTML and fetches data (all in one, no inline scripts)
-        js = """
+def _install_native_crc32c() -> None:
+    """Route TensorBoard's event-file checksums through ``google-crc32c``.
+
+    Without TensorFlow, TensorBoard reads event files through a stub whose
+    CRC32C is a per-byte Python loop, which dominates ``Reload()``. The stub
+    looks ``crc32c``/``crc_update`` up as module globals on every record, so
+    replacing them is enough. A no-op unless the C extension is available.
+    """
+    if google_crc32c is None or google_crc32c.implementation != "c":
+        return
+    try:
+        from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+    except ImportError:
+        return
+    pywrap_tensorflow.crc_update = google_crc32c.extend
+    pywrap_tensorflow.crc32c = google_crc32c.value
+
+
+# How often the background thread rebuilds the cached summary payload.
+_SUMMARY_REFRESH_SECS = 10.0
+# How long a cold summary request waits for the first snapshot before
+# answering 202; kept short so requests do not pin WSGI workers.
+_SUMMARY_WAIT_SECS = 0.25
+# Retry-After of the 202 answer, in seconds.
+_SUMMARY_RETRY_AFTER_SECS = 1
+# Browser cache lifetime of the summary response, in seconds.
+_SUMMARY_MAX_AGE_SECS = 5
+# Summary bodies are compressed once per snapshot rather than per request.
+_SUMMARY_GZIP_LEVEL = 6
+# How often the refresher re-checks whether the plugin has data.
+_ACTIVE_PROBE_SECS = 30.0
+# Browser cache lifetime of the static index page and ES module, in seconds.
+_STATIC_MAX_AGE_SECS = 3600
+
+# Summary fields and the tag suffixes they are read from, in fallback order.
+_SUMMARY_COLUMNS = (
+    ("accuracy_fp32", ("metrics/accuracy/fp32",)),
+    ("accuracy_int8", ("metrics/accuracy/int8",)),
+    ("accuracy_drop", ("compression/accuracy_drop",)),
+    ("size_ratio", ("compression/size_ratio",)),
+    ("speedup", ("compression/speedup",)),
+    ("memory_reduction_mb", ("compression/memory_reduction_mb",)),
+    ("energy_reduction_mw", ("compression/energy_reduction_mw",)),
+    ("model_size_fp32", ("performance/model_size_mb/fp32",)),
+    ("model_size_int8", ("performance/model_size_mb/int8",)),
+    ("latency_fp32", ("performance/latency_ms/fp32", "performance/latency/fp32")),
+    ("latency_int8", ("performance/latency_ms/int8", "performance/latency/int8")),
+    ("memory_fp32", ("performance/memory_usage_mb/fp32", "performance/memory_usage/fp32")),
+    ("memory_int8", ("performance/memory_usage_mb/int8", "performance/memory_usage/int8")),
+    ("energy_fp32", ("performance/energy_mw/fp32", "performance/energy_consumption_mw/fp32", "performance/energy/fp32")),
+    ("energy_int8", ("performance/energy_mw/int8", "performance/energy_consumption_mw/int8", "performance/energy/int8")),
+)
+_SUMMARY_TAG_SUFFIXES = tuple(
+    suffix for _, suffixes in _SUMMARY_COLUMNS for suffix in suffixes
+)
+# The same table split into parallel tuples; row values are filled by index.
+_SUMMARY_ROW_KEYS = ("run",) + tuple(key for key, _ in _SUMMARY_COLUMNS)
+_SUMMARY_FALLBACKS = tuple(suffixes for _, suffixes in _SUMMARY_COLUMNS)
+# Display formats matching the dashboard's formatRatio; other fields use formatVal.
+_SUMMARY_FORMATS = {"size_ratio": "{:.2f}x", "speedup": "{:.2f}x"}
+
+
+def _scalar_tags_by_run(runs: Dict[str, Any]) -> Dict[str, Any]:
+    """Map each run of ``EventMultiplexer.Runs()`` to its scalar tags."""
+    return {run_name: run_info.get("scalars", ()) for run_name, run_info in runs.items()}
+
+
+def _summary_tag_filter(run_names) -> provider.RunTagFilter:
+    """Return a filter selecting the summary tags of ``run_names``."""
+    return provider.RunTagFilter(
+        runs=run_names,
+        tags=[
+            run_name + "/" + suffix
+            for run_name in run_names
+            for suffix in _SUMMARY_TAG_SUFFIXES
+        ],
+    )
+
+
+def _accumulator_token(accumulator: Any):
+    """Return the number of events ``accumulator`` has loaded so far.
+
+    ``EventAccumulator.most_recent_wall_time`` stays at ``-1`` for event
+    files of version 2 and later, so it cannot tell whether a run got new
+    data. Instead the accumulator's ``_ProcessEvent`` is wrapped, the first
+    time the run is seen, to bump a per-run counter for every event that
+    ``Reload()`` loads. Reading the token costs no ``Scalars()`` copy.
+    Returns ``None`` for accumulators without that hook.
+    """
+    counter = getattr(accumulator, "_compression_event_count", None)
+    if counter is None:
+        process_event = getattr(accumulator, "_ProcessEvent", None)
+        if process_event is None:
+            return None
+        counter = [0]
+
+        def counting_process_event(event):
+            counter[0] += 1
+            return process_event(event)
+
+        accumulator._ProcessEvent = counting_process_event
+        accumulator._compression_event_count = counter
+    return counter[0]
+
+
+def _accumulator_row(run_name: str, accumulator: Any, tags) -> Dict[str, Any]:
+    """Build the summary row of one run from its ``EventAccumulator``."""
+    # Membership test instead of letting missing tags raise
+    tags_set = set(tags)
+    prefix = run_name + "/"
+    series = {}
+    for suffix in _SUMMARY_TAG_SUFFIXES:
+        full_tag = prefix + suffix
+        if full_tag in tags_set:
+            series[full_tag] = accumulator.Scalars(full_tag)
+    return _summary_row(run_name, series)
+
+
+def _summary_row(run_name: str, series: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one summary row from a ``{full_tag: scalar_points}`` mapping."""
+    prefix = run_name + "/"
+    values = [None] * len(_SUMMARY_ROW_KEYS)
+    values[0] = run_name
+    for i, suffixes in enumerate(_SUMMARY_FALLBACKS, 1):
+        for suffix in suffixes:
+            points = series.get(prefix + suffix)
+            if points:
+                values[i] = float(points[-1].value)
+                break
+    row = dict(zip(_SUMMARY_ROW_KEYS, values))
+    # Display strings are part of the cached snapshot, so the dashboard does
+    # not re-format every cell on each render.
+    for key, value in zip(_SUMMARY_ROW_KEYS[1:], values[1:]):
+        if value is not None:
+            row[key + "_fmt"] = _SUMMARY_FORMATS.get(key, "{:.4f}").format(value)
+    return row
+
+
+# Placeholder page for the plugin root; the dashboard loads via the ES module.
+_INDEX_HTML = """<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Compression Dashboard</title>
+</head>
+<body>
+  <div>This endpoint is not used. The plugin loads via ES module.</div>
+</body>
+</html>"""
+
+# ES module that renders HTML and fetches data (all in one, no inline scripts)
+_RENDER_JS = """
 export function render() {
   // Get theme colors from TensorBoard's parent window
   // TensorBoard uses CSS variables and computed styles that change with theme toggle
@@ -549,7 +669,7 @@ export function render() {
       const style = div.getAttribute('style') || '';
       if (style.includes('color:')) {
         // Replace any color value with the new text color
-        const newStyle = style.replace(/color:\s*[^;]+/gi, 'color: ' + newTextColor);
+        const newStyle = style.replace(/color:\\s*[^;]+/gi, 'color: ' + newTextColor);
         div.setAttribute('style', newStyle);
       }
     });
@@ -559,7 +679,7 @@ export function render() {
       const style = div.getAttribute('style') || '';
       if (style.includes('color:')) {
         // Replace any color value with the new text color
-        const newStyle = style.replace(/color:\s*[^;]+/gi, 'color: ' + newTextColor);
+        const newStyle = style.replace(/color:\\s*[^;]+/gi, 'color: ' + newTextColor);
         div.setAttribute('style', newStyle);
       }
     });
@@ -569,12 +689,12 @@ export function render() {
       const style = el.getAttribute('style') || '';
       if (style.includes('color:')) {
         // Only update if it's not a background color or border color
-        const colorMatch = style.match(/color:\s*([^;]+)/i);
+        const colorMatch = style.match(/color:\\s*([^;]+)/i);
         if (colorMatch) {
           const oldColor = colorMatch[1].trim();
           // Only update if it looks like a text color (not a background or border)
           if (!oldColor.includes('background') && !oldColor.includes('border')) {
-            const newStyle = style.replace(/color:\s*[^;]+/gi, 'color: ' + newTextColor);
+            const newStyle = style.replace(/color:\\s*[^;]+/gi, 'color: ' + newTextColor);
             el.setAttribute('style', newStyle);
           }
         }
@@ -1223,7 +1343,9 @@ export function render() {
   // State management
   let allRuns = [];
   let runColors = new Map();
-  let visibleRuns = new Set();
+  // Run visibility as a bitset indexed by each run's dense _id
+  let visibleMask = new Uint8Array(0);
+  let visibleCount = 0;
   let searchTerm = '';
   let sortColumn = null;
   let sortDirection = 'asc';
@@ -1232,6 +1354,22 @@ export function render() {
   const formatVal = (val) => val !== null && val !== undefined ? val.toFixed(4) : '-';
   const formatRatio = (val) => val !== null && val !== undefined ? val.toFixed(2) + 'x' : '-';
   
+  // Coalesce DOM class writes from event handlers into one animation frame
+  const pendingWrites = [];
+  let writeScheduled = false;
+  function scheduleWrite(fn) {
+    pendingWrites.push(fn);
+    if (writeScheduled) {
+      return;
+    }
+    writeScheduled = true;
+    requestAnimationFrame(() => {
+      writeScheduled = false;
+      const writes = pendingWrites.splice(0, pendingWrites.length);
+      writes.forEach(write => write());
+    });
+  }
+  
   // Assign colors to runs (TensorBoard style)
   function assignRunColors() {
     allRuns.forEach((run, index) => {
@@ -1253,7 +1391,7 @@ export function render() {
     
     filteredRuns.forEach(run => {
       const color = runColors.get(run.run) || TENSORBOARD_COLORS[0];
-      const isVisible = visibleRuns.has(run.run);
+      const isVisible = visibleMask[run._id] === 1;
       
       const item = document.createElement('div');
       item.className = 'run-item' + (isVisible ? '' : ' disabled');
@@ -1262,10 +1400,10 @@ export function render() {
       checkbox.type = 'checkbox';
       checkbox.checked = isVisible;
       checkbox.addEventListener('change', (e) => {
-        if (e.target.checked) {
-          visibleRuns.add(run.run);
-        } else {
-          visibleRuns.delete(run.run);
+        const checked = e.target.checked ? 1 : 0;
+        if (visibleMask[run._id] !== checked) {
+          visibleMask[run._id] = checked;
+          visibleCount += checked ? 1 : -1;
         }
         updateRunCount();
         render();
@@ -1296,14 +1434,13 @@ export function render() {
   // Update run count display
   function updateRunCount() {
     const runCountEl = document.getElementById('runCount');
-    const visibleCount = visibleRuns.size;
     const totalCount = allRuns.length;
     runCountEl.textContent = visibleCount + ' of ' + totalCount + ' runs';
   }
   
   // Render table and charts
   function render() {
-    let runs = allRuns.filter(r => visibleRuns.has(r.run));
+    let runs = allRuns.filter(r => visibleMask[r._id]);
     
     // Calculate ratios for sorting
     runs = runs.map(r => {
@@ -1433,18 +1570,20 @@ export function render() {
       expandBtn.innerHTML = '⛶';
       expandBtn.addEventListener('click', (e) => {
         e.stopPropagation();
-        const isExpanded = chartWrapper.classList.contains('expanded');
-        if (isExpanded) {
-          chartWrapper.classList.remove('expanded');
-          expandBtn.title = 'Expand chart to full width';
-        } else {
-          // Collapse other expanded charts
-          document.querySelectorAll('.chart-wrapper.expanded').forEach(w => {
-            w.classList.remove('expanded');
-          });
-          chartWrapper.classList.add('expanded');
-          expandBtn.title = 'Collapse chart to normal size';
-        }
+        scheduleWrite(() => {
+          const isExpanded = chartWrapper.classList.contains('expanded');
+          if (isExpanded) {
+            chartWrapper.classList.remove('expanded');
+            expandBtn.title = 'Expand chart to full width';
+          } else {
+            // Collapse other expanded charts
+            document.querySelectorAll('.chart-wrapper.expanded').forEach(w => {
+              w.classList.remove('expanded');
+            });
+            chartWrapper.classList.add('expanded');
+            expandBtn.title = 'Collapse chart to normal size';
+          }
+        });
         // Re-render chart to adjust to new size
         setTimeout(() => renderParetoChart(runs, config.id, config.xKey, config.xLabel), 150);
       });
@@ -1472,9 +1611,10 @@ export function render() {
     cardContent.appendChild(innerBox);
     
     cardHeader.addEventListener('click', () => {
-      cardContent.classList.toggle('collapsed');
-      const chevron = cardHeader.querySelector('.card-header-chevron');
-      chevron.classList.toggle('collapsed');
+      scheduleWrite(() => {
+        cardContent.classList.toggle('collapsed');
+        chevronDiv.classList.toggle('collapsed');
+      });
     });
     
     chartCard.appendChild(cardHeader);
@@ -1510,7 +1650,7 @@ export function render() {
     
     const downloadLink = document.createElement('a');
     downloadLink.href = svgUrl;
-    downloadLink.download = (chartTitle || 'chart').toLowerCase().replace(/\s+/g, '_') + '.svg';
+    downloadLink.download = (chartTitle || 'chart').toLowerCase().replace(/\\s+/g, '_') + '.svg';
     document.body.appendChild(downloadLink);
     downloadLink.click();
     document.body.removeChild(downloadLink);
@@ -1658,11 +1798,11 @@ export function render() {
         const html = '<div class="tooltip-title">' + d.run + ' (' + d.type + ')</div>' +
           '<div class="tooltip-row"><span class="tooltip-label">Accuracy:</span><span class="tooltip-value">' + formatVal(d.y) + '</span></div>' +
           '<div class="tooltip-row"><span class="tooltip-label">Model Size:</span><span class="tooltip-value">' + d.x.toFixed(2) + ' MB</span></div>' +
-          (r.accuracy_drop !== null && r.accuracy_drop !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Accuracy Drop:</span><span class="tooltip-value">' + formatVal(r.accuracy_drop) + '</span></div>' : '') +
-          (r.size_ratio !== null && r.size_ratio !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Size Ratio:</span><span class="tooltip-value">' + formatRatio(r.size_ratio) + '</span></div>' : '') +
-          (r.speedup !== null && r.speedup !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Speedup:</span><span class="tooltip-value">' + formatRatio(r.speedup) + '</span></div>' : '') +
-          (r.memory_reduction_mb !== null && r.memory_reduction_mb !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Memory Reduction:</span><span class="tooltip-value">' + formatVal(r.memory_reduction_mb) + ' MB</span></div>' : '') +
-          (r.energy_reduction_mw !== null && r.energy_reduction_mw !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Energy Reduction:</span><span class="tooltip-value">' + formatVal(r.energy_reduction_mw) + ' mW</span></div>' : '');
+          (r.accuracy_drop !== null && r.accuracy_drop !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Accuracy Drop:</span><span class="tooltip-value">' + (r.accuracy_drop_fmt || formatVal(r.accuracy_drop)) + '</span></div>' : '') +
+          (r.size_ratio !== null && r.size_ratio !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Size Ratio:</span><span class="tooltip-value">' + (r.size_ratio_fmt || formatRatio(r.size_ratio)) + '</span></div>' : '') +
+          (r.speedup !== null && r.speedup !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Speedup:</span><span class="tooltip-value">' + (r.speedup_fmt || formatRatio(r.speedup)) + '</span></div>' : '') +
+          (r.memory_reduction_mb !== null && r.memory_reduction_mb !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Memory Reduction:</span><span class="tooltip-value">' + (r.memory_reduction_mb_fmt || formatVal(r.memory_reduction_mb)) + ' MB</span></div>' : '') +
+          (r.energy_reduction_mw !== null && r.energy_reduction_mw !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Energy Reduction:</span><span class="tooltip-value">' + (r.energy_reduction_mw_fmt || formatVal(r.energy_reduction_mw)) + ' mW</span></div>' : '');
         
         tooltip.innerHTML = html;
         tooltip.style.display = 'block';
@@ -1932,11 +2072,11 @@ export function render() {
       const html = '<div class="tooltip-title">' + d.run + ' (' + d.type + ')</div>' +
         '<div class="tooltip-row"><span class="tooltip-label">Accuracy:</span><span class="tooltip-value">' + formatVal(d.y) + '</span></div>' +
         '<div class="tooltip-row"><span class="tooltip-label">Model Size:</span><span class="tooltip-value">' + d.x.toFixed(2) + ' MB</span></div>' +
-        (r.accuracy_drop !== null && r.accuracy_drop !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Accuracy Drop:</span><span class="tooltip-value">' + formatVal(r.accuracy_drop) + '</span></div>' : '') +
-        (r.size_ratio !== null && r.size_ratio !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Size Ratio:</span><span class="tooltip-value">' + formatRatio(r.size_ratio) + '</span></div>' : '') +
-        (r.speedup !== null && r.speedup !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Speedup:</span><span class="tooltip-value">' + formatRatio(r.speedup) + '</span></div>' : '') +
-        (r.memory_reduction_mb !== null && r.memory_reduction_mb !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Memory Reduction:</span><span class="tooltip-value">' + formatVal(r.memory_reduction_mb) + ' MB</span></div>' : '') +
-        (r.energy_reduction_mw !== null && r.energy_reduction_mw !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Energy Reduction:</span><span class="tooltip-value">' + formatVal(r.energy_reduction_mw) + ' mW</span></div>' : '');
+        (r.accuracy_drop !== null && r.accuracy_drop !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Accuracy Drop:</span><span class="tooltip-value">' + (r.accuracy_drop_fmt || formatVal(r.accuracy_drop)) + '</span></div>' : '') +
+        (r.size_ratio !== null && r.size_ratio !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Size Ratio:</span><span class="tooltip-value">' + (r.size_ratio_fmt || formatRatio(r.size_ratio)) + '</span></div>' : '') +
+        (r.speedup !== null && r.speedup !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Speedup:</span><span class="tooltip-value">' + (r.speedup_fmt || formatRatio(r.speedup)) + '</span></div>' : '') +
+        (r.memory_reduction_mb !== null && r.memory_reduction_mb !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Memory Reduction:</span><span class="tooltip-value">' + (r.memory_reduction_mb_fmt || formatVal(r.memory_reduction_mb)) + ' MB</span></div>' : '') +
+        (r.energy_reduction_mw !== null && r.energy_reduction_mw !== undefined ? '<div class="tooltip-row"><span class="tooltip-label">Energy Reduction:</span><span class="tooltip-value">' + (r.energy_reduction_mw_fmt || formatVal(r.energy_reduction_mw)) + ' mW</span></div>' : '');
       
       tooltip.innerHTML = html;
       tooltip.style.display = 'block';
@@ -2230,7 +2370,7 @@ export function render() {
   
   // Export to CSV
   function exportToCSV() {
-    const visibleRunsData = allRuns.filter(r => visibleRuns.has(r.run));
+    const visibleRunsData = allRuns.filter(r => visibleMask[r._id]);
     if (visibleRunsData.length === 0) {
       alert('No runs selected to export');
       return;
@@ -2269,371 +2409,691 @@ export function render() {
     return fp32 / int8;
   }
   
-  // Render relative metrics table (ratios)
-  function renderRelativeMetricsTable(runs) {
-    const root = document.getElementById('root');
-    if (!runs || runs.length === 0) {
-      return;
+  // Static column definitions for the metrics tables
+  const RELATIVE_METRICS_COLUMNS = [
+    { key: 'run', label: 'Run', class: 'run-name sortable' },
+    { key: 'accuracy_ratio', label: 'Accuracy Ratio', class: 'sortable' },
+    { key: 'latency_ratio', label: 'Latency Ratio', class: 'sortable' },
+    { key: 'energy_ratio', label: 'Energy Ratio', class: 'sortable' },
+    { key: 'size_ratio', label: 'Size Ratio', class: 'sortable' }
+  ];
+  const RAW_METRICS_COLUMNS = [
+    { key: 'run', label: 'Run', class: 'run-name sortable' },
+    { key: 'accuracy_fp32', label: 'FP32 Accuracy', class: 'sortable' },
+    { key: 'accuracy_int8', label: 'INT8 Accuracy', class: 'sortable' },
+    { key: 'latency_fp32', label: 'FP32 Latency (ms)', class: 'sortable' },
+    { key: 'latency_int8', label: 'INT8 Latency (ms)', class: 'sortable' },
+    { key: 'energy_fp32', label: 'FP32 Energy (mW)', class: 'sortable' },
+    { key: 'energy_int8', label: 'INT8 Energy (mW)', class: 'sortable' },
+    { key: 'model_size_fp32', label: 'FP32 Size (MB)', class: 'sortable' },
+    { key: 'model_size_int8', label: 'INT8 Size (MB)', class: 'sortable' }
+  ];
+  
+  // Table shells (card, thead, handlers) are built once; re-renders only
+  // replace the tbody rows and flip the sort classes on the cached <th>s.
+  const metricsTables = {};
+  
+  function ensureMetricsTable(id, title, metadata, innerHeader, columns) {
+    const cached = metricsTables[id];
+    if (cached && document.getElementById(id + 'Card')) {
+      return cached;
     }
     
-    let html = '<div class="card" id="relativeMetricsCard"><div class="card-header" id="relativeMetricsCardHeader"><div style="flex: 1;"><div class="card-header-title">Relative Metrics Table</div><div class="card-header-metadata">compression/relative_metrics</div></div><div class="card-header-chevron" id="relativeMetricsChevron">▼</div></div><div class="card-content" id="relativeMetricsCardContent"><div class="inner-content-box"><div class="inner-content-header">Ratios (FP32 / INT8)</div><div class="inner-content-body"><div class="table-container"><table><thead><tr>';
-    const columns = [
-      { key: 'run', label: 'Run', class: 'run-name sortable' },
-      { key: 'accuracy_ratio', label: 'Accuracy Ratio', class: 'sortable' },
-      { key: 'latency_ratio', label: 'Latency Ratio', class: 'sortable' },
-      { key: 'energy_ratio', label: 'Energy Ratio', class: 'sortable' },
-      { key: 'size_ratio', label: 'Size Ratio', class: 'sortable' }
-    ];
-    
+    let html = '<div class="card" id="' + id + 'Card"><div class="card-header" id="' + id + 'CardHeader"><div style="flex: 1;"><div class="card-header-title">' + title + '</div><div class="card-header-metadata">' + metadata + '</div></div><div class="card-header-chevron" id="' + id + 'Chevron">▼</div></div><div class="card-content" id="' + id + 'CardContent"><div class="inner-content-box"><div class="inner-content-header">' + innerHeader + '</div><div class="inner-content-body"><div class="table-container"><table><thead><tr>';
     columns.forEach(col => {
-      let className = col.class || '';
-      if (sortColumn === col.key) {
-        className += ' sort-' + sortDirection;
-      }
-      html += '<th class="' + className + '" data-column="' + col.key + '">' + col.label + '</th>';
+      html += '<th class="' + col.class + '" data-column="' + col.key + '">' + col.label + '</th>';
     });
-    html += '</tr></thead><tbody>';
+    html += '</tr></thead><tbody></tbody></table></div></div></div></div></div>';
+    document.getElementById('root').insertAdjacentHTML('beforeend', html);
     
-    runs.forEach(r => {
-      html += '<tr>' +
-        '<td class="run-name">' + r.run + '</td>' +
-        '<td>' + formatRatio(r.accuracy_ratio) + '</td>' +
-        '<td>' + formatRatio(r.latency_ratio) + '</td>' +
-        '<td>' + formatRatio(r.energy_ratio) + '</td>' +
-        '<td>' + formatRatio(r.size_ratio) + '</td>' +
-        '</tr>';
+    const card = document.getElementById(id + 'Card');
+    const headers = {};
+    card.querySelectorAll('th[data-column]').forEach(th => {
+      headers[th.getAttribute('data-column')] = th;
     });
-    html += '</tbody></table></div></div></div></div></div>';
-    
-    // Replace or append relative metrics table
-    const existingRelative = root.querySelector('#relativeMetricsCard');
-    if (existingRelative) {
-      existingRelative.outerHTML = html;
-    } else {
-      root.insertAdjacentHTML('beforeend', html);
-    }
     
-    // Add sort handlers
-    document.querySelectorAll('#relativeMetricsCardContent th.sortable').forEach(th => {
-      th.addEventListener('click', () => {
-        const column = th.getAttribute('data-column');
-        if (sortColumn === column) {
-          sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
-        } else {
-          sortColumn = column;
-          sortDirection = 'asc';
-        }
-        render();
-      });
+    // Add sort handler (delegated to the header row)
+    card.querySelector('thead').addEventListener('click', (e) => {
+      const th = e.target.closest('th.sortable');
+      if (!th) {
+        return;
+      }
+      const column = th.getAttribute('data-column');
+      if (sortColumn === column) {
+        sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+      } else {
+        sortColumn = column;
+        sortDirection = 'asc';
+      }
+      render();
     });
     
-    // Add collapse handlers
-    const relativeMetricsCardHeader = document.getElementById('relativeMetricsCardHeader');
-    const relativeMetricsCardContent = document.getElementById('relativeMetricsCardContent');
-    const relativeMetricsChevron = document.getElementById('relativeMetricsChevron');
-    if (relativeMetricsCardHeader && relativeMetricsCardContent && relativeMetricsChevron) {
-      relativeMetricsCardHeader.addEventListener('click', () => {
-        const isCollapsed = relativeMetricsCardContent.classList.contains('collapsed');
-        if (isCollapsed) {
-          relativeMetricsCardContent.classList.remove('collapsed');
-          relativeMetricsChevron.classList.remove('collapsed');
-        } else {
-          relativeMetricsCardContent.classList.add('collapsed');
-          relativeMetricsChevron.classList.add('collapsed');
-        }
+    // Add collapse handler
+    const cardContent = document.getElementById(id + 'CardContent');
+    const chevron = document.getElementById(id + 'Chevron');
+    document.getElementById(id + 'CardHeader').addEventListener('click', () => {
+      scheduleWrite(() => {
+        cardContent.classList.toggle('collapsed');
+        chevron.classList.toggle('collapsed');
       });
+    });
+    
+    const table = { headers: headers, tbody: card.querySelector('tbody') };
+    metricsTables[id] = table;
+    return table;
+  }
+  
+  // Build rows in a fragment and swap them in with a single DOM insertion
+  function fillTableBody(tbody, runs, cells) {
+    const frag = document.createDocumentFragment();
+    for (const r of runs) {
+      const tr = document.createElement('tr');
+      const name = document.createElement('td');
+      name.className = 'run-name';
+      name.textContent = r.run;
+      tr.appendChild(name);
+      tr.insertAdjacentHTML('beforeend', cells(r));
+      frag.appendChild(tr);
     }
+    tbody.replaceChildren(frag);
+  }
+  
+  function updateSortClasses(headers) {
+    for (const key in headers) {
+      const th = headers[key];
+      th.classList.remove('sort-asc', 'sort-desc');
+      if (key === sortColumn) {
+        th.classList.add('sort-' + sortDirection);
+      }
+    }
+  }
+  
+  // Render relative metrics table (ratios)
+  function renderRelativeMetricsTable(runs) {
+    if (!runs || runs.length === 0) {
+      return;
+    }
+    
+    const table = ensureMetricsTable('relativeMetrics', 'Relative Metrics Table', 'compression/relative_metrics', 'Ratios (FP32 / INT8)', RELATIVE_METRICS_COLUMNS);
+    updateSortClasses(table.headers);
+    
+    fillTableBody(table.tbody, runs, r =>
+      '<td>' + formatRatio(r.accuracy_ratio) + '</td>' +
+      '<td>' + formatRatio(r.latency_ratio) + '</td>' +
+      '<td>' + formatRatio(r.energy_ratio) + '</td>' +
+      '<td>' + (r.size_ratio_fmt || formatRatio(r.size_ratio)) + '</td>'
+    );
   }
   
   // Render raw metrics table
   function renderRawMetricsTable(runs) {
-    const root = document.getElementById('root');
     if (!runs || runs.length === 0) {
       return;
     }
     
-    let html = '<div class="card" id="rawMetricsCard"><div class="card-header" id="rawMetricsCardHeader"><div style="flex: 1;"><div class="card-header-title">Raw Metrics Table</div><div class="card-header-metadata">compression/raw_metrics</div></div><div class="card-header-chevron" id="rawMetricsChevron">▼</div></div><div class="card-content" id="rawMetricsCardContent"><div class="inner-content-box"><div class="inner-content-header">Raw Values</div><div class="inner-content-body"><div class="table-container"><table><thead><tr>';
-    const columns = [
-      { key: 'run', label: 'Run', class: 'run-name sortable' },
-      { key: 'accuracy_fp32', label: 'FP32 Accuracy', class: 'sortable' },
-      { key: 'accuracy_int8', label: 'INT8 Accuracy', class: 'sortable' },
-      { key: 'latency_fp32', label: 'FP32 Latency (ms)', class: 'sortable' },
-      { key: 'latency_int8', label: 'INT8 Latency (ms)', class: 'sortable' },
-      { key: 'energy_fp32', label: 'FP32 Energy (mW)', class: 'sortable' },
-      { key: 'energy_int8', label: 'INT8 Energy (mW)', class: 'sortable' },
-      { key: 'model_size_fp32', label: 'FP32 Size (MB)', class: 'sortable' },
-      { key: 'model_size_int8', label: 'INT8 Size (MB)', class: 'sortable' }
-    ];
-    
-    columns.forEach(col => {
-      let className = col.class || '';
-      if (sortColumn === col.key) {
-        className += ' sort-' + sortDirection;
+    const table = ensureMetricsTable('rawMetrics', 'Raw Metrics Table', 'compression/raw_metrics', 'Raw Values', RAW_METRICS_COLUMNS);
+    updateSortClasses(table.headers);
+    
+    fillTableBody(table.tbody, runs, r =>
+      '<td>' + (r.accuracy_fp32_fmt || formatVal(r.accuracy_fp32)) + '</td>' +
+      '<td>' + (r.accuracy_int8_fmt || formatVal(r.accuracy_int8)) + '</td>' +
+      '<td>' + (r.latency_fp32_fmt || formatVal(r.latency_fp32)) + '</td>' +
+      '<td>' + (r.latency_int8_fmt || formatVal(r.latency_int8)) + '</td>' +
+      '<td>' + (r.energy_fp32_fmt || formatVal(r.energy_fp32)) + '</td>' +
+      '<td>' + (r.energy_int8_fmt || formatVal(r.energy_int8)) + '</td>' +
+      '<td>' + (r.model_size_fp32_fmt || formatVal(r.model_size_fp32)) + '</td>' +
+      '<td>' + (r.model_size_int8_fmt || formatVal(r.model_size_int8)) + '</td>'
+    );
+  }
+  
+  // Fetch data and render, then keep polling. Unchanged snapshots come back
+  // as 304 (or with the ETag already seen) and back the interval off.
+  const apiUrl = '/data/plugin/compression/api/summary';
+  const POLL_MIN_MS = 5000;
+  const POLL_MAX_MS = 30000;
+  let summaryEtag = null;
+  let pollDelay = POLL_MIN_MS;
+  let initialized = false;
+  
+  // Swap in a new run list; known runs keep their checkbox state, new runs start visible
+  function setRuns(runs) {
+    const known = new Set();
+    const wasVisible = new Set();
+    allRuns.forEach(r => {
+      known.add(r.run);
+      if (visibleMask[r._id]) {
+        wasVisible.add(r.run);
       }
-      html += '<th class="' + className + '" data-column="' + col.key + '">' + col.label + '</th>';
     });
-    html += '</tr></thead><tbody>';
-    
-    runs.forEach(r => {
-      html += '<tr>' +
-        '<td class="run-name">' + r.run + '</td>' +
-        '<td>' + formatVal(r.accuracy_fp32) + '</td>' +
-        '<td>' + formatVal(r.accuracy_int8) + '</td>' +
-        '<td>' + formatVal(r.latency_fp32) + '</td>' +
-        '<td>' + formatVal(r.latency_int8) + '</td>' +
-        '<td>' + formatVal(r.energy_fp32) + '</td>' +
-        '<td>' + formatVal(r.energy_int8) + '</td>' +
-        '<td>' + formatVal(r.model_size_fp32) + '</td>' +
-        '<td>' + formatVal(r.model_size_int8) + '</td>' +
-        '</tr>';
-    });
-    html += '</tbody></table></div></div></div></div></div>';
-    
-    // Replace or append raw metrics table
-    const existingRaw = root.querySelector('#rawMetricsCard');
-    if (existingRaw) {
-      existingRaw.outerHTML = html;
-    } else {
-      root.insertAdjacentHTML('beforeend', html);
-    }
-    
-    // Add sort handlers
-    document.querySelectorAll('#rawMetricsCardContent th.sortable').forEach(th => {
-      th.addEventListener('click', () => {
-        const column = th.getAttribute('data-column');
-        if (sortColumn === column) {
-          sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
-        } else {
-          sortColumn = column;
-          sortDirection = 'asc';
-        }
-        render();
-      });
+    allRuns = runs;
+    visibleMask = new Uint8Array(allRuns.length);
+    visibleCount = 0;
+    allRuns.forEach((run, i) => {
+      run._id = i;
+      if (!known.has(run.run) || wasVisible.has(run.run)) {
+        visibleMask[i] = 1;
+        visibleCount++;
+      }
     });
-    
-    // Add collapse handlers
-    const rawMetricsCardHeader = document.getElementById('rawMetricsCardHeader');
-    const rawMetricsCardContent = document.getElementById('rawMetricsCardContent');
-    const rawMetricsChevron = document.getElementById('rawMetricsChevron');
-    if (rawMetricsCardHeader && rawMetricsCardContent && rawMetricsChevron) {
-      rawMetricsCardHeader.addEventListener('click', () => {
-        const isCollapsed = rawMetricsCardContent.classList.contains('collapsed');
-        if (isCollapsed) {
-          rawMetricsCardContent.classList.remove('collapsed');
-          rawMetricsChevron.classList.remove('collapsed');
-        } else {
-          rawMetricsCardContent.classList.add('collapsed');
-          rawMetricsChevron.classList.add('collapsed');
-        }
-      });
-    }
   }
   
-  // Fetch data and render
-  const apiUrl = '/data/plugin/compression/api/summary';
-  fetch(apiUrl)
-    .then(r => {
-      if (!r.ok) {
-        throw new Error('HTTP ' + r.status + ': ' + r.statusText);
-      }
-      return r.json();
-    })
-    .then(data => {
-      if (!data.runs || data.runs.length === 0) {
+  function applySummary(data) {
+    if (!data.runs || data.runs.length === 0) {
+      if (!initialized) {
         document.getElementById('root').textContent = 'No compression data found.';
-        return;
       }
-      
-      allRuns = data.runs;
-      // Initially show all runs
-      allRuns.forEach(run => visibleRuns.add(run.run));
-      
-      // Clear loading message
-      const root = document.getElementById('root');
-      root.innerHTML = '';
-      
+      return;
+    }
+    
+    setRuns(data.runs);
+    
+    if (initialized) {
       assignRunColors();
       renderSidebar();
       render();
-      
-      // Set up theme change listener
-      setupThemeChangeListener();
-      
-      // Update theme colors initially to ensure correct colors on first load
-      updateThemeColors();
-      
-      // Search box handler
-      const searchBox = document.getElementById('searchBox');
-      searchBox.addEventListener('input', (e) => {
-        searchTerm = e.target.value;
-        renderSidebar();
-      });
-      
-      // Select All / Deselect All buttons
-      document.getElementById('selectAllBtn').addEventListener('click', () => {
-        allRuns.forEach(run => visibleRuns.add(run.run));
-        renderSidebar();
-        render();
-      });
-      
-      document.getElementById('deselectAllBtn').addEventListener('click', () => {
-        visibleRuns.clear();
-        renderSidebar();
-        render();
-      });
-      
-    })
-    .catch(e => {
-      console.error('Error:', e);
-      const root = document.getElementById('root');
-      root.innerHTML = '<div class="card"><div class="card-content"><div class="inner-content-box"><div class="inner-content-body" style="text-align: center; padding: 40px; color: ' + textColor + ';">Error: ' + e.message + '</div></div></div></div>';
+      return;
+    }
+    initialized = true;
+    
+    // Clear loading message
+    const root = document.getElementById('root');
+    root.innerHTML = '';
+    
+    assignRunColors();
+    renderSidebar();
+    render();
+    
+    // Set up theme change listener
+    setupThemeChangeListener();
+    
+    // Update theme colors initially to ensure correct colors on first load
+    updateThemeColors();
+    
+    // Search box handler
+    const searchBox = document.getElementById('searchBox');
+    searchBox.addEventListener('input', (e) => {
+      searchTerm = e.target.value;
+      renderSidebar();
     });
+    
+    // Select All / Deselect All buttons
+    document.getElementById('selectAllBtn').addEventListener('click', () => {
+      visibleMask.fill(1);
+      visibleCount = allRuns.length;
+      renderSidebar();
+      render();
+    });
+    
+    document.getElementById('deselectAllBtn').addEventListener('click', () => {
+      visibleMask.fill(0);
+      visibleCount = 0;
+      renderSidebar();
+      render();
+    });
+  }
+  
+  function schedulePoll(changed) {
+    pollDelay = changed ? POLL_MIN_MS : Math.min(pollDelay * 2, POLL_MAX_MS);
+    setTimeout(poll, pollDelay);
+  }
+  
+  function poll() {
+    const options = summaryEtag ? { headers: { 'If-None-Match': summaryEtag } } : {};
+    fetch(apiUrl, options)
+      .then(r => {
+        if (r.status === 304) {
+          return null;
+        }
+        if (r.status === 202) {
+          // Summary still being built: ask again after the advertised delay
+          const retryAfter = Number(r.headers.get('Retry-After')) || 1;
+          setTimeout(poll, retryAfter * 1000);
+          return undefined;
+        }
+        if (!r.ok) {
+          throw new Error('HTTP ' + r.status + ': ' + r.statusText);
+        }
+        // A response served from the browser cache repeats the last ETag
+        const etag = r.headers.get('ETag');
+        if (etag && etag === summaryEtag) {
+          return null;
+        }
+        summaryEtag = etag;
+        return r.json();
+      })
+      .then(data => {
+        if (data === undefined) {
+          return;
+        }
+        if (data) {
+          applySummary(data);
+        }
+        schedulePoll(data !== null);
+      })
+      .catch(e => {
+        console.error('Error:', e);
+        if (!initialized) {
+          const root = document.getElementById('root');
+          root.innerHTML = '<div class="card"><div class="card-content"><div class="inner-content-box"><div class="inner-content-body" style="text-align: center; padding: 40px; color: ' + textColor + ';">Error: ' + e.message + '</div></div></div></div>';
+        }
+        schedulePoll(false);
+      });
+  }
+  
+  poll();
 }
 """
-        response = http_util.Respond(request, js, content_type="application/javascript")
-        return response(environ, start_response)
+
+# Static responses never change at runtime, so their bytes and ETags are
+# computed once at import.
+_INDEX_HTML_BYTES = _INDEX_HTML.encode("utf-8")
+_INDEX_HTML_ETAG = f'"{hashlib.sha1(_INDEX_HTML_BYTES).hexdigest()}"'
+_RENDER_JS_BYTES = _RENDER_JS.encode("utf-8")
+_RENDER_JS_ETAG = f'"{hashlib.sha1(_RENDER_JS_BYTES).hexdigest()}"'
+_RENDER_JS_GZIP = gzip.compress(_RENDER_JS_BYTES, mtime=0)
+
+# Same Accept-Encoding test as ``http_util.Respond``.
+_ALLOWS_GZIP_PATTERN = re.compile(r"(?:^|,|\s)(?:(?:x-)?gzip|\*)(?!;q=0)(?:\s|,|$)")
+
+
+def _serve_static(environ, start_response, body, etag, content_type):
+    """Serve a precomputed static payload, honouring ``If-None-Match``."""
+    request = Request(environ)
+    if request.headers.get("If-None-Match") == etag:
+        response = Response(status=304, headers=[("ETag", etag)])
+    else:
+        response = http_util.Respond(
+            request,
+            body,
+            content_type=content_type,
+            expires=_STATIC_MAX_AGE_SECS,
+            headers=[("ETag", etag)],
+        )
+    return response(environ, start_response)
+
+
+def _serve_precompressed(environ, start_response, body, gzipped_body, etag, content_type):
+    """Serve a static non-HTML payload straight from the WSGI environ.
+
+    Skips building a ``Request`` and running ``http_util.Respond``: the gzip
+    variant is computed at import and only a couple of headers are read.
+    HTML still goes through ``_serve_static`` for TensorBoard's CSP header.
+    """
+    headers = [
+        ("ETag", etag),
+        ("Cache-Control", f"private, max-age={_STATIC_MAX_AGE_SECS}"),
+        ("Vary", "Accept-Encoding"),
+        ("X-Content-Type-Options", "nosniff"),
+    ]
+    if environ.get("HTTP_IF_NONE_MATCH") == etag:
+        response = Response(status=304, headers=headers)
+    else:
+        if _ALLOWS_GZIP_PATTERN.search(environ.get("HTTP_ACCEPT_ENCODING", "")):
+            body = gzipped_body
+            headers.append(("Content-Encoding", "gzip"))
+        response = Response(body, content_type=content_type, headers=headers)
+    return response(environ, start_response)
+
+
+class CompressionPlugin(base_plugin.TBPlugin):
+    """TensorBoard plugin that provides a Compression dashboard tab."""
+
+    plugin_name = "compression"
+
+    def __init__(self, context: base_plugin.TBContext) -> None:
+        super().__init__(context)
+        self._context = context
+        _install_native_crc32c()
+
+        # ``is_active`` only reads this flag; once it has been called, the
+        # refresher thread keeps it up to date.
+        self._active = True
+        self._active_probe_started = False
+
+        # tag filter -> run name -> (number of scalar tags, has compression
+        # tags); shared by the active probe and the summary refresher.
+        self._compression_run_lock = threading.Lock()
+        self._compression_run_index: Dict[str, Dict[str, tuple]] = {}
+
+        # experiment -> run name -> (dirty token, summary row); only touched
+        # by the summary refresher.
+        self._summary_row_cache: Dict[str, Dict[str, tuple]] = {}
+
+        # Summary payloads are built off the request thread. Handlers only
+        # read the latest ``(version, etag, gzipped_body)`` snapshot for
+        # their experiment; ``version`` lets the refresher skip unchanged data.
+        self._summary_lock = threading.Lock()
+        self._summary_ready = threading.Condition(self._summary_lock)
+        self._summary_snapshots: Dict[str, tuple] = {}
+        self._summary_contexts: Dict[str, Any] = {}
+        self._summary_wakeup = threading.Event()
+        # One refresher thread rebuilds the summaries and re-probes
+        # ``is_active``. It starts with the first summary request or
+        # ``is_active`` call and runs until close().
+        self._summary_stop = threading.Event()
+        self._summary_thread = None
+
+    def is_active(self) -> bool:
+        """Return True if the plugin should be shown.
+
+        Scanning runs can be slow, so the answer comes from the refresher
+        thread, which probes on the first call and then every
+        ``_ACTIVE_PROBE_SECS``. Until the first probe finishes the plugin is
+        reported as active.
+        """
+        with self._summary_lock:
+            if not self._active_probe_started:
+                self._active_probe_started = True
+                self._start_refresher()
+                self._summary_wakeup.set()
+        return self._active
+
+    def _start_refresher(self) -> None:
+        """Start the refresher thread if needed; ``_summary_lock`` must be held."""
+        if self._summary_thread is None:
+            self._summary_thread = threading.Thread(
+                target=self._refresh_loop,
+                name="CompressionPluginRefresher",
+                daemon=True,
+            )
+            self._summary_thread.start()
+
+    def _has_compression_data(self) -> bool:
+        """Return False only when runs exist and none has compression tags."""
+        try:
+            multiplexer = getattr(self._context, "multiplexer", None)
+            if not multiplexer:
+                return True
+            runs = multiplexer.Runs()
+            if not runs:
+                return True
+            return bool(self._compression_runs(_scalar_tags_by_run(runs)))
+        except Exception:
+            return True
+
+    def _compression_runs(self, run_to_tags, tag_filter="all") -> list:
+        """Return the runs in ``run_to_tags`` that have compression tags.
+
+        Membership is cached per run and only re-scanned when the run's tag
+        count changes; tags are only ever added to a run. ``tag_filter``
+        names the filter the tags were listed with, so counts of filtered
+        and full tag lists are never compared with each other.
+        """
+        with self._compression_run_lock:
+            index = self._compression_run_index.setdefault(tag_filter, {})
+            compression_runs = []
+            for run_name, tags in run_to_tags.items():
+                entry = index.get(run_name)
+                if entry is None or entry[0] != len(tags):
+                    entry = (len(tags), any("compression/" in t for t in tags))
+                    index[run_name] = entry
+                if entry[1]:
+                    compression_runs.append(run_name)
+            if len(index) > len(run_to_tags):
+                # Forget runs that are gone.
+                self._compression_run_index[tag_filter] = {
+                    run_name: index[run_name] for run_name in run_to_tags if run_name in index
+                }
+        return compression_runs
+
+    def _cached_rows(self, experiment, run_tokens, read_rows) -> list:
+        """Return summary rows for the runs of ``run_tokens``, in order.
+
+        ``run_tokens`` maps each run to a token that changes whenever the run
+        gets new data (``None`` if unknown). Rows are cached per run, and
+        ``read_rows`` is only called with the runs whose token changed; it
+        returns a ``{run: row}`` mapping for them.
+        """
+        cache = self._summary_row_cache.setdefault(experiment, {})
+        stale_runs = [
+            run_name
+            for run_name, token in run_tokens.items()
+            if token is None or cache.get(run_name, (None,))[0] != token
+        ]
+        if stale_runs:
+            for run_name, row in read_rows(stale_runs).items():
+                cache[run_name] = (run_tokens[run_name], row)
+        if len(cache) > len(run_tokens):
+            # Forget runs that are gone.
+            self._summary_row_cache[experiment] = {
+                run_name: cache[run_name] for run_name in run_tokens
+            }
+        return [cache[run_name][1] for run_name in run_tokens]
+
+    def frontend_metadata(self):
+        """Return frontend metadata."""
+        return base_plugin.FrontendMetadata(
+            # TensorBoard does: "." + es_module_path for import
+            # Iframe loads from /data/plugin_entry.html?name=compression
+            # Base href is "plugin/compression/" but ES modules don't respect <base>
+            # So import("./render.js") resolves to /data/render.js (wrong!)
+            # We need import("./plugin/compression/render.js") to resolve to /data/plugin/compression/render.js
+            # So es_module_path should be "/plugin/compression/render.js"
+            es_module_path="/plugin/compression/render.js",
+            tab_name="COMPRESSION",
+            disable_reload=False,
+        )
+
+    def get_plugin_apps(self) -> Dict[str, Any]:
+        # Return handlers directly - TensorBoard will call them with (environ, start_response).
+        # Routes must start with a slash.
+        return {
+            "/": self._serve_index,
+            "/render.js": self._serve_render_module,
+            "/api/summary": self._serve_summary,
+        }
+    
+    def _serve_render_module(self, environ, start_response):
+        """Serve an ES module that renders our HTML directly."""
+        return _serve_precompressed(
+            environ,
+            start_response,
+            _RENDER_JS_BYTES,
+            _RENDER_JS_GZIP,
+            _RENDER_JS_ETAG,
+            "application/javascript; charset=utf-8",
+        )
 
     def _serve_index(self, environ, start_response):
         """Serve the dashboard HTML."""
-        request = Request(environ)
-        html = """<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Compression Dashboard</title>
-</head>
-<body>
-  <div>This endpoint is not used. The plugin loads via ES module.</div>
-</body>
-</html>"""
-        response = http_util.Respond(request, html, content_type="text/html")
-        return response(environ, start_response)
+        return _serve_static(
+            environ, start_response, _INDEX_HTML_BYTES, _INDEX_HTML_ETAG, "text/html"
+        )
 
     def _serve_summary(self, environ, start_response):
         """Return compression metrics as JSON."""
         request = Request(environ)
+        ctx = plugin_util.context(environ)
+        experiment = plugin_util.experiment_id(environ)
+
+        with self._summary_ready:
+            # Remember the latest context so the refresher can keep this
+            # experiment's snapshot warm.
+            self._summary_contexts[experiment] = ctx
+            self._start_refresher()
+            if experiment not in self._summary_snapshots:
+                # Cold start: wake the refresher instead of waiting for its
+                # next scheduled pass, and only briefly wait for it.
+                self._summary_wakeup.set()
+                if not self._summary_ready.wait_for(
+                    lambda: experiment in self._summary_snapshots,
+                    timeout=_SUMMARY_WAIT_SECS,
+                ):
+                    response = Response(
+                        status=202,
+                        headers=[("Retry-After", str(_SUMMARY_RETRY_AFTER_SECS))],
+                    )
+                    return response(environ, start_response)
+            _, etag, body = self._summary_snapshots[experiment]
+
+        if request.headers.get("If-None-Match") == etag:
+            response = Response(status=304, headers=[("ETag", etag)])
+            return response(environ, start_response)
+
+        # The body is stored gzipped; Respond inflates it for clients that
+        # do not accept gzip.
+        response = http_util.Respond(
+            request,
+            body,
+            content_type="application/json",
+            expires=_SUMMARY_MAX_AGE_SECS,
+            content_encoding="gzip",
+            headers=[("ETag", etag)],
+        )
+        return response(environ, start_response)
+
+    def close(self) -> None:
+        """Stop the refresher thread, if it was started."""
+        self._summary_stop.set()
+        self._summary_wakeup.set()
+        with self._summary_lock:
+            thread = self._summary_thread
+        if thread is not None:
+            thread.join()
+
+    def _refresh_loop(self):
+        """Periodically re-probe ``is_active`` and rebuild the summaries."""
+        next_probe = 0.0
+        while not self._summary_stop.is_set():
+            self._summary_wakeup.wait(_SUMMARY_REFRESH_SECS)
+            self._summary_wakeup.clear()
+            if self._summary_stop.is_set():
+                return
+            try:
+                if self._active_probe_started and time.monotonic() >= next_probe:
+                    self._active = self._has_compression_data()
+                    next_probe = time.monotonic() + _ACTIVE_PROBE_SECS
+                self._refresh_summaries()
+            except Exception:
+                # Keep the thread alive; the next pass tries again.
+                logger.exception("Compression plugin refresh failed")
+
+    def _refresh_summaries(self):
+        """Rebuild the summary snapshot of every known experiment."""
+        with self._summary_lock:
+            pending = [
+                (experiment, ctx, self._summary_snapshots.get(experiment))
+                for experiment, ctx in self._summary_contexts.items()
+            ]
+        for experiment, ctx, snapshot in pending:
+            cached_version = snapshot[0] if snapshot else None
+            version, body = self._build_summary(ctx, experiment, cached_version)
+            if body is None:
+                continue
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            body = gzip.compress(body, compresslevel=_SUMMARY_GZIP_LEVEL, mtime=0)
+            with self._summary_ready:
+                self._summary_snapshots[experiment] = (version, etag, body)
+                self._summary_ready.notify_all()
+
+    def _build_summary(self, ctx, experiment, cached_version=None):
+        """Collect compression metrics for all runs and serialize them.
+
+        Returns a ``(version, body)`` pair. ``version`` is a cheap token
+        derived from the latest step/wall time of every run (``None`` if it
+        cannot be determined); when it equals ``cached_version`` the runs are
+        not read again and ``body`` is ``None``. Otherwise only runs with new
+        data are read; the other rows come from ``_cached_rows``.
+        """
+        version = None
         try:
             # Try data_provider first (new API), fall back to multiplexer (old API)
             data_provider = getattr(self._context, "data_provider", None)
             multiplexer = getattr(self._context, "multiplexer", None)
             
             if data_provider:
-                # Use data_provider API (like scalars plugin does)
-                from tensorboard.data import provider
-                from tensorboard.plugins.scalar import metadata as scalar_metadata
-                
-                ctx = plugin_util.context(environ)
-                experiment = plugin_util.experiment_id(environ)
-                
-                # List all scalar tags
+                # Use data_provider API (like scalars plugin does). Only the
+                # summary tags are listed: tags are prefixed with the run
+                # name, so they can be named up front and the provider skips
+                # the rest of the scalar catalog.
+                run_names = [
+                    run.run_name
+                    for run in data_provider.list_runs(ctx, experiment_id=experiment)
+                ]
                 scalar_mapping = data_provider.list_scalars(
                     ctx,
                     experiment_id=experiment,
                     plugin_name=scalar_metadata.PLUGIN_NAME,
+                    run_tag_filter=_summary_tag_filter(run_names),
                 )
+                run_tokens = {
+                    run_name: frozenset(
+                        (tag, ts.max_step, ts.max_wall_time)
+                        for tag, ts in tag_to_metadata.items()
+                    )
+                    for run_name, tag_to_metadata in scalar_mapping.items()
+                }
+                version = frozenset(run_tokens.items())
+                if version == cached_version:
+                    return version, None
+                
+                # Runs that have compression tags
+                compression_runs = self._compression_runs(scalar_mapping, "summary")
                 
-                runs_data = []
-                for run_name, tag_to_metadata in scalar_mapping.items():
-                    # Check if this run has compression tags
-                    compression_tags = [t for t in tag_to_metadata.keys() if "compression/" in t]
-                    if not compression_tags:
-                        continue
-                    
-                    # Read scalar values for this run
-                    run_tag_filter = provider.RunTagFilter(runs=[run_name])
+                def read_rows(stale_runs):
+                    # Read scalar values for all stale runs in a single call.
+                    # Only the latest point of each summary tag is used, and
+                    # the provider always keeps the last point when
+                    # downsampling.
                     all_scalars = data_provider.read_scalars(
                         ctx,
                         experiment_id=experiment,
                         plugin_name=scalar_metadata.PLUGIN_NAME,
-                        downsample=500,
-                        run_tag_filter=run_tag_filter,
+                        downsample=1,
+                        run_tag_filter=_summary_tag_filter(stale_runs),
                     )
-                    
-                    run_scalars = all_scalars.get(run_name, {})
-                    
-                    def get_scalar(tag_suffix):
-                        full_tag = f"{run_name}/{tag_suffix}"
-                        scalars = run_scalars.get(full_tag)
-                        if scalars:
-                            return float(scalars[-1].value)
-                        return None
-                    
-                    runs_data.append({
-                        "run": run_name,
-                        "accuracy_fp32": get_scalar("metrics/accuracy/fp32"),
-                        "accuracy_int8": get_scalar("metrics/accuracy/int8"),
-                        "accuracy_drop": get_scalar("compression/accuracy_drop"),
-                        "size_ratio": get_scalar("compression/size_ratio"),
-                        "speedup": get_scalar("compression/speedup"),
-                        "memory_reduction_mb": get_scalar("compression/memory_reduction_mb"),
-                        "energy_reduction_mw": get_scalar("compression/energy_reduction_mw"),
-                        "model_size_fp32": get_scalar("performance/model_size_mb/fp32"),
-                        "model_size_int8": get_scalar("performance/model_size_mb/int8"),
-                        "latency_fp32": get_scalar("performance/latency_ms/fp32") or get_scalar("performance/latency/fp32"),
-                        "latency_int8": get_scalar("performance/latency_ms/int8") or get_scalar("performance/latency/int8"),
-                        "memory_fp32": get_scalar("performance/memory_usage_mb/fp32") or get_scalar("performance/memory_usage/fp32"),
-                        "memory_int8": get_scalar("performance/memory_usage_mb/int8") or get_scalar("performance/memory_usage/int8"),
-                        "energy_fp32": get_scalar("performance/energy_mw/fp32") or get_scalar("performance/energy_consumption_mw/fp32") or get_scalar("performance/energy/fp32"),
-                        "energy_int8": get_scalar("performance/energy_mw/int8") or get_scalar("performance/energy_consumption_mw/int8") or get_scalar("performance/energy/int8"),
-                    })
+                    return {
+                        run_name: _summary_row(run_name, all_scalars.get(run_name, {}))
+                        for run_name in stale_runs
+                    }
                 
-                body = json.dumps({"runs": runs_data})
+                runs_data = self._cached_rows(
+                    experiment,
+                    {run_name: run_tokens[run_name] for run_name in compression_runs},
+                    read_rows,
+                )
+                
+                body = _dumps({"runs": runs_data})
             elif multiplexer:
                 # Fall back to old multiplexer API - use accumulator directly
-                runs_data = []
                 runs = multiplexer.Runs()
+                accumulators = {
+                    run_name: multiplexer.GetAccumulator(run_name) for run_name in runs
+                }
+                run_to_tags = _scalar_tags_by_run(runs)
+                run_tokens = {
+                    run_name: _accumulator_token(accumulator)
+                    for run_name, accumulator in accumulators.items()
+                    if accumulator
+                }
+                if all(token is not None for token in run_tokens.values()):
+                    version = frozenset(run_tokens.items())
+                if version is not None and version == cached_version:
+                    return version, None
+                
                 
-                for run_name in runs.keys():
-                    try:
-                        accumulator = multiplexer.GetAccumulator(run_name)
-                        if not accumulator:
-                            continue
-                        
-                        tags_dict = accumulator.Tags()
-                        tags = tags_dict.get("scalars", [])
-                        if not tags:
-                            continue
-                        
-                        compression_tags = [t for t in tags if "compression/" in t]
-                        if not compression_tags:
-                            continue
-                        
-                        # Get scalar values from accumulator.scalars
-                        def get_scalar(tag_suffix):
-                            full_tag = f"{run_name}/{tag_suffix}"
-                            try:
-                                items = accumulator.scalars.Items(full_tag)
-                                return float(items[-1].value) if items else None
-                            except Exception:
-                                return None
-                        
-                        runs_data.append({
-                            "run": run_name,
-                            "accuracy_fp32": get_scalar("metrics/accuracy/fp32"),
-                            "accuracy_int8": get_scalar("metrics/accuracy/int8"),
-                            "accuracy_drop": get_scalar("compression/accuracy_drop"),
-                            "size_ratio": get_scalar("compression/size_ratio"),
-                            "speedup": get_scalar("compression/speedup"),
-                            "memory_reduction_mb": get_scalar("compression/memory_reduction_mb"),
-                            "energy_reduction_mw": get_scalar("compression/energy_reduction_mw"),
-                            "model_size_fp32": get_scalar("performance/model_size_mb/fp32"),
-                            "model_size_int8": get_scalar("performance/model_size_mb/int8"),
-                            "latency_fp32": get_scalar("performance/latency_ms/fp32") or get_scalar("performance/latency/fp32"),
-                            "latency_int8": get_scalar("performance/latency_ms/int8") or get_scalar("performance/latency/int8"),
-                            "memory_fp32": get_scalar("performance/memory_usage_mb/fp32") or get_scalar("performance/memory_usage/fp32"),
-                            "memory_int8": get_scalar("performance/memory_usage_mb/int8") or get_scalar("performance/memory_usage/int8"),
-                            "energy_fp32": get_scalar("performance/energy_mw/fp32") or get_scalar("performance/energy_consumption_mw/fp32") or get_scalar("performance/energy/fp32"),
-                            "energy_int8": get_scalar("performance/energy_mw/int8") or get_scalar("performance/energy_consumption_mw/int8") or get_scalar("performance/energy/int8"),
-                        })
-                    except Exception:
-                        continue
+                def read_rows(stale_runs):
+                    return {
+                        run_name: _accumulator_row(
+                            run_name, accumulators[run_name], run_to_tags[run_name]
+                        )
+                        for run_name in stale_runs
+                    }
                 
-                body = json.dumps({"runs": runs_data})
+                runs_data = self._cached_rows(
+                    experiment,
+                    {
+                        run_name: run_tokens[run_name]
+                        for run_name in self._compression_runs(run_to_tags)
+                        if accumulators[run_name]
+                    },
+                    read_rows,
+                )
+                
+                body = _dumps({"runs": runs_data})
             else:
-                body = json.dumps({"runs": [], "error": "neither data_provider nor multiplexer available"})
+                body = _dumps({"runs": [], "error": "neither data_provider nor multiplexer available"})
         except Exception as e:
-            body = json.dumps({"runs": [], "error": str(e)})
-        
-        # Return Response object as WSGI app - call it to get iterable
-        response = http_util.Respond(request, body, content_type="application/json")
-        return response(environ, start_response)
+            version = None
+            body = _dumps({"runs": [], "error": str(e)})
+        return version, body
@@ -10,7 +10,6 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 from pathlib import Path
 
@@ -62,15 +61,11 @@ Examples:
     
     args = parser.parse_args()
     
-    # Validate JSON file exists
-    if not os.path.exists(args.json_path):
-        print(f"Error: File not found: {args.json_path}", file=sys.stderr)
-        sys.exit(1)
-    
     if not args.json_path.endswith('.json'):
         print(f"Warning: File does not have .json extension: {args.json_path}", file=sys.stderr)
     
-    # Create parser and log results
+    # Create parser and log results. The parser opens the file once and
+    # reports missing or non-JSON files itself.
     try:
         print(f"Loading benchmark results from: {args.json_path}")
         parser = BenchmarkParser()
@@ -85,8 +80,12 @@ Examples:
         
         writer.close()
         
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.json_path}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        # JSON decode errors are ValueErrors too
+        print(f"Error: Invalid JSON file: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         if 'JSON' in str(type(e).__name__):
@@ -6,10 +6,67 @@ This module provides functionality to parse compression benchmark
 results from JSON files and convert them to TensorBoard event format.
 """
 
+import codecs
+import contextlib
+import io
 import json
 import os
-from typing import Dict, Optional, Union
-from ..compression import CompressionWriter
+from collections.abc import Iterator, Set
+from typing import Any, Optional, Union
+
+from ..proto.summary_pb2 import Summary
+from ..summary import hparams
+from .writer import CompressionWriter, _SyncCompressionWriter, _SyncFileWriter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Metrics that feed the paired HParams columns (see _hparam_metrics).
+_HPARAM_KEYS = frozenset({
+    'accuracy', 'model_size_mb', 'latency_mean_ms', 'memory_usage_mb', 'energy_consumption_mw',
+})
+
+# (metric key, FP32 tag suffix, INT8 tag suffix) for the extra metrics
+# logged alongside the CompressionWriter groups.
+_ADDITIONAL_TAGS = (
+    ('sensitivity', '/metrics/sensitivity/fp32', '/metrics/sensitivity/int8'),
+    ('specificity', '/metrics/specificity/fp32', '/metrics/specificity/int8'),
+    ('latency_std_ms', '/performance/latency_std_ms/fp32', '/performance/latency_std_ms/int8'),
+)
+
+def _open_benchmark_json(json_path: str):
+    """Open a benchmark file for binary reading.
+
+    A single ``open`` stands in for an existence check, and the first
+    non-whitespace byte after an optional UTF-8 BOM rejects files that are
+    not a JSON object before any parsing starts. The returned file is
+    positioned after the BOM. The file is closed if any of these checks fail.
+    """
+    with contextlib.ExitStack() as stack:
+        try:
+            f = stack.enter_context(open(json_path, 'rb'))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Benchmark file not found: {json_path}") from None
+        start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+        f.seek(start)
+        while True:
+            chunk = f.read(io.DEFAULT_BUFFER_SIZE)
+            head = chunk.lstrip()
+            if head or not chunk:
+                break
+        if head and not head.startswith(b'{'):
+            raise ValueError(f"Benchmark file is not a JSON object: {json_path}")
+        f.seek(start)
+        # Hand the open file to the caller.
+        stack.pop_all()
+    return f
 
 
 class BenchmarkParser:
@@ -21,6 +78,8 @@ class BenchmarkParser:
         >>> parser = BenchmarkParser()
         >>> parser.log_benchmark_results('results/benchmark.json')
     """
+
+    __slots__ = ('writer',)
     
     def __init__(self, writer: Optional[CompressionWriter] = None):
         """Initialize BenchmarkParser.
@@ -30,8 +89,10 @@ class BenchmarkParser:
         """
         self.writer = writer
     
-    def load_benchmark_json(self, json_path: str) -> Dict:
+    def load_benchmark_json(self, json_path: str) -> dict:
         """Load benchmark results from JSON file.
+
+        Uses ``orjson`` when it is installed.
         
         Args:
             json_path: Path to the benchmark JSON file
@@ -41,13 +102,52 @@ class BenchmarkParser:
             
         Raises:
             FileNotFoundError: If JSON file doesn't exist
+            ValueError: If the file does not start with a JSON object
             json.JSONDecodeError: If JSON file is invalid
         """
-        if not os.path.exists(json_path):
-            raise FileNotFoundError(f"Benchmark file not found: {json_path}")
-        
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        with _open_benchmark_json(json_path) as f:
+            data = f.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity literals that json.dump
+                # writes by default; let the stdlib parser handle those.
+                pass
+        return json.loads(data)
+
+    def iter_benchmark_models(self, json_path: str) -> Iterator[tuple[str, Any]]:
+        """Iterate over the ``(model_name, model_data)`` pairs of a benchmark file.
+
+        When ``ijson`` is installed the file is streamed, so only one model's
+        results are held in memory at a time; otherwise it is loaded with
+        :meth:`load_benchmark_json`.
+
+        Args:
+            json_path: Path to the benchmark JSON file
+
+        Raises:
+            FileNotFoundError: If JSON file doesn't exist
+            ValueError: If the file does not start with a JSON object
+        """
+        if ijson is None:
+            return iter(self.load_benchmark_json(json_path).items())
+        # Opened here rather than in the generator so errors surface at once
+        return self._stream_benchmark_json(json_path, _open_benchmark_json(json_path))
+
+    def _stream_benchmark_json(self, json_path: str, f) -> Iterator[tuple[str, Any]]:
+        seen = set()
+        try:
+            with f:
+                for model_name, model_data in ijson.kvitems(f, '', use_float=True):
+                    seen.add(model_name)
+                    yield model_name, model_data
+        except ijson.JSONError:
+            # yajl rejects the NaN/Infinity literals that json.dump writes by
+            # default; finish the remaining models with the in-memory parser.
+            for model_name, model_data in self.load_benchmark_json(json_path).items():
+                if model_name not in seen:
+                    yield model_name, model_data
     
     def log_benchmark_results(
         self,
@@ -63,10 +163,11 @@ class BenchmarkParser:
             step: Global step for logging (default: 0 for benchmark results)
             
         Returns:
-            CompressionWriter instance used for logging
+            CompressionWriter instance used for logging. If the file has no
+            complete models this is a new writer that the caller must close.
         """
-        # Load benchmark data
-        benchmark_data = self.load_benchmark_json(json_path)
+        # Load benchmark data, one model at a time when streaming is available
+        benchmark_models = self.iter_benchmark_models(json_path)
         
         # Determine base logdir for per-model runs (scalars)
         if logdir is None:
@@ -80,89 +181,123 @@ class BenchmarkParser:
         # the main scalar run list. Users can point TensorBoard at this
         # directory when they want the table view.
         hparams_logdir = f'{base_logdir}_hparams'
-        hparams_writer = CompressionWriter(logdir=hparams_logdir)
         
         # Process each model in the benchmark results
-        # Create one run per model for better organization in TensorBoard
-        writers = []
-        for model_name, model_data in benchmark_data.items():
-            if not isinstance(model_data, dict):
-                continue
-            
-            # Extract FP32 and INT8 metrics
-            fp32_metrics = model_data.get('fp32', {})
-            int8_metrics = model_data.get('int8', {})
-            model_info = model_data.get('model_info', {})
-            
-            # Skip if missing required data
-            if not fp32_metrics or not int8_metrics:
-                continue
-            
-            # Create a separate writer for each model (one run per model)
-            if self.writer is None:
-                model_writer = CompressionWriter(logdir=f'{base_logdir}/{model_name}')
-            else:
-                # If writer provided, use it but still organize by model name in tags
-                model_writer = self.writer
-            
-            # Log compression comparison (side-by-side metrics)
-            model_writer.log_compression_comparison(
-                model_name, fp32_metrics, int8_metrics, step
-            )
-            
-            # Log compression ratios (derived metrics)
-            model_writer.log_compression_ratios(
-                model_name, fp32_metrics, int8_metrics, step
-            )
-            
-            # Log energy comparison
-            model_writer.log_energy_comparison(
-                model_name, fp32_metrics, int8_metrics, step
+        # Create one run per model for better organization in TensorBoard.
+        # The compression dashboard keys its rows by run, so the models are
+        # not merged into one shared writer.
+        last_writer = None
+        for model_name, model_data in benchmark_models:
+            model_writer = self._log_one_model(
+                model_name, model_data, base_logdir, step, hparams_logdir
             )
-            
-            # Log model metadata
-            if model_info:
-                model_writer.log_model_metadata(model_name, model_info, step)
-            
-            # Log additional metrics individually for detailed analysis
-            self._log_additional_metrics(model_name, fp32_metrics, int8_metrics, step, model_writer)
-
-            # Log compression metrics as HParams row for dashboard-style view
-            # Use a dedicated writer rooted at ``*_hparams`` so these runs
-            # live in a separate tree from the main scalar runs.
-            self._log_hparams(
-                model_name,
-                fp32_metrics,
-                int8_metrics,
-                model_info,
-                hparams_writer,
-            )
-            
-            if self.writer is None:
-                model_writer.close()
-                writers.append(model_writer)
+            if model_writer is not None:
+                last_writer = model_writer
         
         # Return the first writer if using shared writer, or create a dummy return
         if self.writer is not None:
             return self.writer
-        elif writers:
+        elif last_writer is not None:
             # Return a reference to the last writer for compatibility
             # In practice, all writers are already closed
-            return writers[-1]
+            return last_writer
         else:
-            # Create a dummy writer if no models processed
-            if logdir is None:
-                base_name = os.path.splitext(os.path.basename(json_path))[0]
-                logdir = f'runs/compression_benchmark/{base_name}'
-            return CompressionWriter(logdir=logdir)
+            # Create a writer if no models processed; the caller owns it
+            return CompressionWriter(logdir=base_logdir)
     
+    def _log_one_model(
+        self,
+        model_name: str,
+        model_data: Any,
+        base_logdir: str,
+        step: int,
+        hparams_logdir: str,
+    ) -> Optional[CompressionWriter]:
+        """Log one model's benchmark results.
+
+        Args:
+            model_name: Name of the model
+            model_data: The model's entry in the benchmark file
+            base_logdir: Parent directory of the per-model runs
+            step: Global step for logging
+            hparams_logdir: The ``*_hparams`` directory holding the HParams sessions
+
+        Returns:
+            The closed per-model writer, or None if the model was skipped or
+            the shared ``self.writer`` was used
+        """
+        if not isinstance(model_data, dict):
+            return None
+        
+        # Extract FP32 and INT8 metrics
+        fp32_metrics = model_data.get('fp32', {})
+        int8_metrics = model_data.get('int8', {})
+        model_info = model_data.get('model_info', {})
+        
+        # Skip if missing required data
+        if not fp32_metrics or not int8_metrics:
+            return None
+        
+        # Metric names present for both precisions, shared by all the
+        # logging calls below
+        common_keys = fp32_metrics.keys() & int8_metrics.keys()
+        
+        # Create a separate writer for each model (one run per model)
+        if self.writer is None:
+            model_writer = _SyncCompressionWriter(logdir=f'{base_logdir}/{model_name}')
+        else:
+            # If writer provided, use it but still organize by model name in tags
+            model_writer = self.writer
+        
+        # Log compression comparison (side-by-side metrics)
+        model_writer.log_compression_comparison(
+            model_name, fp32_metrics, int8_metrics, step, common_keys
+        )
+        
+        # Log compression ratios (derived metrics)
+        model_writer.log_compression_ratios(
+            model_name, fp32_metrics, int8_metrics, step, common_keys
+        )
+        
+        # Log energy comparison
+        model_writer.log_energy_comparison(
+            model_name, fp32_metrics, int8_metrics, step, common_keys
+        )
+        
+        # Log model metadata
+        if model_info:
+            model_writer.log_model_metadata(model_name, model_info, step)
+        
+        # Log additional metrics individually for detailed analysis
+        self._log_additional_metrics(
+            model_name, fp32_metrics, int8_metrics, step, model_writer, common_keys
+        )
+
+        # Log compression metrics as HParams row for dashboard-style view
+        # The sessions live under ``*_hparams`` so these runs are in a
+        # separate tree from the main scalar runs. Every model is its own
+        # session directory.
+        self._log_hparams(
+            model_name,
+            fp32_metrics,
+            int8_metrics,
+            model_info,
+            hparams_logdir,
+        )
+        
+        if self.writer is not None:
+            return None
+        model_writer.close()
+        return model_writer
+
     def _log_additional_metrics(
         self,
         model_name: str,
-        fp32_metrics: Dict,
-        int8_metrics: Dict,
+        fp32_metrics: dict,
+        int8_metrics: dict,
         step: int,
-        writer: Optional[CompressionWriter] = None
+        writer: Optional[CompressionWriter] = None,
+        common_keys: Optional[Set[str]] = None,
     ) -> None:
         """Log additional metrics that aren't covered by main methods.
         
@@ -172,88 +307,69 @@ class BenchmarkParser:
             int8_metrics: INT8 metrics dictionary
             step: Global step for logging
             writer: CompressionWriter to use (defaults to self.writer)
+            common_keys: Metric names present in both dicts (computed if None)
         """
         if writer is None:
             writer = self.writer
         if writer is None:
             return
+        if common_keys is None:
+            common_keys = fp32_metrics.keys() & int8_metrics.keys()
         
-        # Sensitivity and Specificity
-        if 'sensitivity' in fp32_metrics and 'sensitivity' in int8_metrics:
-            writer.add_scalar(
-                f'{model_name}/metrics/sensitivity/fp32',
-                fp32_metrics['sensitivity'],
-                step,
-            )
-            writer.add_scalar(
-                f'{model_name}/metrics/sensitivity/int8',
-                int8_metrics['sensitivity'],
-                step,
-            )
-        
-        if 'specificity' in fp32_metrics and 'specificity' in int8_metrics:
-            writer.add_scalar(
-                f'{model_name}/metrics/specificity/fp32',
-                fp32_metrics['specificity'],
-                step,
-            )
-            writer.add_scalar(
-                f'{model_name}/metrics/specificity/int8',
-                int8_metrics['specificity'],
-                step,
-            )
-        
-        # Latency standard deviation
-        if 'latency_std_ms' in fp32_metrics and 'latency_std_ms' in int8_metrics:
-            writer.add_scalar(
-                f'{model_name}/performance/latency_std_ms/fp32',
-                fp32_metrics['latency_std_ms'],
-                step,
-            )
-            writer.add_scalar(
-                f'{model_name}/performance/latency_std_ms/int8',
-                int8_metrics['latency_std_ms'],
-                step,
-            )
+        scalars = []
+        append = scalars.append
+
+        for key, fp32_suffix, int8_suffix in _ADDITIONAL_TAGS:
+            if key in common_keys:
+                append((model_name + fp32_suffix, fp32_metrics[key]))
+                append((model_name + int8_suffix, int8_metrics[key]))
         
         # GPU memory usage (if available)
-        if 'gpu_memory_usage_mb' in fp32_metrics and 'gpu_memory_usage_mb' in int8_metrics:
+        if 'gpu_memory_usage_mb' in common_keys:
             fp32_gpu = fp32_metrics['gpu_memory_usage_mb']
             int8_gpu = int8_metrics['gpu_memory_usage_mb']
             if fp32_gpu > 0 or int8_gpu > 0:  # Only log if GPU was used
-                writer.add_scalar(
-                    f'{model_name}/performance/gpu_memory_mb/fp32',
+                append((
+                    model_name + '/performance/gpu_memory_mb/fp32',
                     fp32_gpu,
-                    step,
-                )
-                writer.add_scalar(
-                    f'{model_name}/performance/gpu_memory_mb/int8',
+                ))
+                append((
+                    model_name + '/performance/gpu_memory_mb/int8',
                     int8_gpu,
-                    step,
-                )
+                ))
         
         # Evaluation device
         if 'evaluated_on' in fp32_metrics:
             device = fp32_metrics['evaluated_on']
             # Encode device as numeric for visualization
             device_code = 1 if device == 'gpu' else 0
-            writer.add_scalar(f'{model_name}/metadata/device_gpu', device_code, step)
+            append((model_name + '/metadata/device_gpu', device_code))
+
+        writer._add_scalars_bulk(scalars, step)
 
     def _log_hparams(
         self,
         model_name: str,
-        fp32_metrics: Dict,
-        int8_metrics: Dict,
-        model_info: Dict,
-        hparams_writer: CompressionWriter,
+        fp32_metrics: dict,
+        int8_metrics: dict,
+        model_info: dict,
+        hparams_logdir: str,
     ) -> None:
         """Log per-model compression metrics using the HParams API.
 
         This turns the HParams tab into a compression dashboard where each row
         is a model and columns are metrics like accuracy, size_ratio, speedup.
         """
+        # Build metric dict (must be numeric). Prefix with 'hparam/' to keep
+        # them separate from regular scalar plots.
+        metrics = _hparam_metrics(fp32_metrics, int8_metrics)
+
+        # If we have no numeric metrics, skip logging hparams for this model
+        if not metrics:
+            return
+
         # Build hparam dict (can contain strings and numbers)
-        hparams: Dict[str, Union[str, float, int]] = {
+        hparams: dict[str, Union[str, float, int]] = {
             "model_name": model_name,
         }
 
@@ -262,50 +378,88 @@ class BenchmarkParser:
         if "category" in model_info:
             hparams["category"] = model_info["category"]
 
-        # Build metric dict (must be numeric). Prefix with 'hparam/' to keep
-        # them separate from regular scalar plots.
-        metrics: Dict[str, float] = {}
-
-        acc_fp32 = fp32_metrics.get("accuracy")
-        acc_int8 = int8_metrics.get("accuracy")
-        if isinstance(acc_fp32, (int, float)):
-            metrics["hparam/accuracy_fp32"] = float(acc_fp32)
-        if isinstance(acc_int8, (int, float)):
-            metrics["hparam/accuracy_int8"] = float(acc_int8)
-        if isinstance(acc_fp32, (int, float)) and isinstance(acc_int8, (int, float)):
-            metrics["hparam/accuracy_drop"] = float(acc_fp32) - float(acc_int8)
-
-        size_fp32 = fp32_metrics.get("model_size_mb")
-        size_int8 = int8_metrics.get("model_size_mb")
-        if isinstance(size_fp32, (int, float)) and isinstance(size_int8, (int, float)) and size_int8 > 0:
-            metrics["hparam/size_ratio"] = float(size_fp32) / float(size_int8)
-
-        lat_fp32 = fp32_metrics.get("latency_mean_ms")
-        lat_int8 = int8_metrics.get("latency_mean_ms")
-        if isinstance(lat_fp32, (int, float)) and isinstance(lat_int8, (int, float)) and lat_int8 > 0:
-            metrics["hparam/speedup"] = float(lat_fp32) / float(lat_int8)
-
-        mem_fp32 = fp32_metrics.get("memory_usage_mb")
-        mem_int8 = int8_metrics.get("memory_usage_mb")
-        if isinstance(mem_fp32, (int, float)) and isinstance(mem_int8, (int, float)):
-            metrics["hparam/memory_reduction_mb"] = float(mem_fp32) - float(mem_int8)
-
-        energy_fp32 = fp32_metrics.get("energy_consumption_mw")
-        energy_int8 = int8_metrics.get("energy_consumption_mw")
-        if isinstance(energy_fp32, (int, float)) and isinstance(energy_int8, (int, float)):
-            metrics["hparam/energy_reduction_mw"] = float(energy_fp32) - float(energy_int8)
-
-        # If we have no numeric metrics, skip logging hparams for this model
-        if not metrics:
-            return
-
         # Use model_name as the hparam session name so each model becomes one
         # row in the HParams table.
-        hparams_writer.add_hparams(
-            hparam_dict=hparams,
-            metric_dict=metrics,
-            name=model_name,
-        )
+        _write_hparams_session(os.path.join(hparams_logdir, model_name), hparams, metrics)
+
+
+def _write_hparams_session(
+    session_logdir: str,
+    hparam_dict: dict[str, Union[str, float, int]],
+    metric_dict: dict[str, float],
+) -> None:
+    """Write one HParams session, as :meth:`SummaryWriter.add_hparams` does.
+
+    ``add_hparams`` opens a full ``SummaryWriter`` (queue and flush thread)
+    for every session. Here the experiment, session start/end summaries and
+    the metric values go through one synchronous writer, with all metrics in
+    a single event.
+    """
+    exp, ssi, sei = hparams(hparam_dict, metric_dict)
+    file_writer = _SyncFileWriter(session_logdir)
+    try:
+        file_writer.add_summary(exp)
+        file_writer.add_summary(ssi)
+        file_writer.add_summary(sei)
+        file_writer.add_summary(Summary(value=[
+            Summary.Value(tag=tag, simple_value=value)
+            for tag, value in metric_dict.items()
+        ]))
+    finally:
+        file_writer.close()
+
+
+def _number(metrics: dict, key: str) -> Optional[float]:
+    """Return ``metrics[key]`` as a float, or ``None`` if it is not numeric."""
+    value = metrics.get(key)
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def _hparam_metrics(fp32_metrics: dict, int8_metrics: dict) -> dict[str, float]:
+    """Derive the numeric HParams metrics of one model.
+
+    Each input value is looked up and type-checked once, and only for the
+    metrics both precisions report.
+    """
+    metrics: dict[str, float] = {}
+    present = fp32_metrics.keys() & int8_metrics.keys() & _HPARAM_KEYS
+    if not present and "accuracy" not in fp32_metrics and "accuracy" not in int8_metrics:
+        return metrics
+
+    acc_fp32 = _number(fp32_metrics, "accuracy")
+    acc_int8 = _number(int8_metrics, "accuracy")
+    if acc_fp32 is not None:
+        metrics["hparam/accuracy_fp32"] = acc_fp32
+    if acc_int8 is not None:
+        metrics["hparam/accuracy_int8"] = acc_int8
+        if acc_fp32 is not None:
+            metrics["hparam/accuracy_drop"] = acc_fp32 - acc_int8
+
+    if "model_size_mb" in present:
+        size_fp32 = _number(fp32_metrics, "model_size_mb")
+        size_int8 = _number(int8_metrics, "model_size_mb")
+        if size_fp32 is not None and size_int8 is not None and size_int8 > 0:
+            metrics["hparam/size_ratio"] = size_fp32 / size_int8
+
+    if "latency_mean_ms" in present:
+        lat_fp32 = _number(fp32_metrics, "latency_mean_ms")
+        lat_int8 = _number(int8_metrics, "latency_mean_ms")
+        if lat_fp32 is not None and lat_int8 is not None and lat_int8 > 0:
+            metrics["hparam/speedup"] = lat_fp32 / lat_int8
+
+    if "memory_usage_mb" in present:
+        mem_fp32 = _number(fp32_metrics, "memory_usage_mb")
+        mem_int8 = _number(int8_metrics, "memory_usage_mb")
+        if mem_fp32 is not None and mem_int8 is not None:
+            metrics["hparam/memory_reduction_mb"] = mem_fp32 - mem_int8
+
+    if "energy_consumption_mw" in present:
+        energy_fp32 = _number(fp32_metrics, "energy_consumption_mw")
+        energy_int8 = _number(int8_metrics, "energy_consumption_mw")
+        if energy_fp32 is not None and energy_int8 is not None:
+            metrics["hparam/energy_reduction_mw"] = energy_fp32 - energy_int8
+
+    return metrics
 
 
 def log_benchmark_results(
@@ -330,4 +484,3 @@ def log_benchmark_results(
     """
     parser = BenchmarkParser()
     return parser.log_benchmark_results(json_path, logdir, step)
-
@@ -7,8 +7,26 @@ during model training, including loss, accuracy, F1 scores, and early
 stopping information.
 """
 
-from typing import Optional, Dict, List, Union
-from ..compression import CompressionWriter
+import atexit
+import functools
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Optional, Union
+
+import numpy as np
+
+from ..proto.summary_pb2 import Summary
+from ..summary import hparams
+from .writer import CompressionWriter, _SyncCompressionWriter
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of epochs waiting for the background writer thread before
+# log_epoch blocks.
+_WRITE_QUEUE_SIZE = 256
 
 
 class TrainingLogger:
@@ -32,26 +50,143 @@ class TrainingLogger:
         self,
         model_name: str,
         writer: Optional[CompressionWriter] = None,
-        logdir: Optional[str] = None
+        logdir: Optional[str] = None,
+        log_every: int = 1,
+        unchanged_tolerance: Optional[float] = None,
+        force_write_every: int = 10
     ):
         """Initialize TrainingLogger.
         
         Args:
             model_name: Name of the model being trained
-            writer: Optional CompressionWriter instance. If None, creates a new one.
+            writer: Optional CompressionWriter instance. If None, one is created
+                the first time something is logged. It can also be replaced
+                later by assigning to :attr:`writer`.
             logdir: Directory for TensorBoard logs (default: runs/training/{model_name})
+            log_every: Number of epochs buffered in memory before their
+                metrics are written (default: 1, write every epoch). Call
+                :meth:`close` (or use the logger as a context manager) to
+                write the last, partial batch; an exit hook only covers
+                loggers still open at normal interpreter shutdown.
+            unchanged_tolerance: If set, an epoch metric is skipped when it
+                differs from the last value written for its tag by less than
+                this (default: None, write every value)
+            force_write_every: With ``unchanged_tolerance``, a metric is
+                still written at least every ``force_write_every`` epochs, so
+                its curve keeps extending (default: 10)
         """
+        if log_every < 1:
+            raise ValueError(f'log_every must be at least 1, got {log_every}')
+        if force_write_every < 1:
+            raise ValueError(f'force_write_every must be at least 1, got {force_write_every}')
         self.model_name = model_name
+        # Tags only depend on the model name, so they are formatted once
+        self._tags = {
+            'train_loss': f'{model_name}/training/loss',
+            'train_acc': f'{model_name}/training/accuracy',
+            'train_f1': f'{model_name}/training/f1_score',
+            'val_loss': f'{model_name}/validation/loss',
+            'val_acc': f'{model_name}/validation/accuracy',
+            'val_f1': f'{model_name}/validation/f1_score',
+            'train_sensitivity': f'{model_name}/training/sensitivity',
+            'train_specificity': f'{model_name}/training/specificity',
+            'val_sensitivity': f'{model_name}/validation/sensitivity',
+            'val_specificity': f'{model_name}/validation/specificity',
+            'learning_rate': f'{model_name}/training/learning_rate',
+            'loss_train': f'{model_name}/loss/train',
+            'loss_val': f'{model_name}/loss/val',
+            'accuracy_train': f'{model_name}/accuracy/train',
+            'accuracy_val': f'{model_name}/accuracy/val',
+            'f1_score_train': f'{model_name}/f1_score/train',
+            'f1_score_val': f'{model_name}/f1_score/val',
+            'early_stopping_patience': f'{model_name}/training/early_stopping_patience',
+            'early_stopping_min_delta': f'{model_name}/training/early_stopping_min_delta',
+            'early_stopped': f'{model_name}/training/early_stopped',
+            'best_epoch': f'{model_name}/training/best_epoch',
+            'best_val_f1': f'{model_name}/training/best_val_f1',
+            'final_train_loss': f'{model_name}/training/final_train_loss',
+            'final_train_acc': f'{model_name}/training/final_train_acc',
+            'final_train_f1': f'{model_name}/training/final_train_f1',
+            'final_val_loss': f'{model_name}/validation/final_val_loss',
+            'final_val_acc': f'{model_name}/validation/final_val_acc',
+            'final_val_f1': f'{model_name}/validation/final_val_f1',
+        }
         
-        if writer is None:
-            if logdir is None:
-                logdir = f'runs/training/{model_name}'
-            self.writer = CompressionWriter(logdir=logdir)
-        else:
-            self.writer = writer
+        # The writer is created on first use, so a logger that never logs
+        # does not leave an empty event file behind
+        self._writer = writer
+        # Whether _writer was created here (and is closed when replaced)
+        self._owns_writer = False
+        self._logdir = logdir if logdir is not None else f'runs/training/{model_name}'
+        self._writer_lock = threading.Lock()
         
         self.best_val_f1 = 0.0
         self.best_epoch = 0
+        self._es_params_logged = False
+        self._log_every = log_every
+        self._unchanged_tolerance = unchanged_tolerance
+        self._force_write_every = force_write_every
+        # tag -> [last written value, epochs skipped since]
+        self._last: dict[str, list[float]] = {}
+        # (epoch, walltime, [(tag, value), ...]) for epochs not yet written
+        self._buffer: list[tuple[int, float, list[tuple[str, float]]]] = []
+        # Epoch summaries are built and written on a background thread so
+        # the training loop only pays for a queue put. The thread is started
+        # when the first epoch is logged.
+        self._queue: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        # First exception raised on the writer thread, re-raised by
+        # flush() or close()
+        self._error: Optional[BaseException] = None
+        # The thread is a daemon, so pending epochs would be lost at exit
+        # without close(); this hook closes loggers that are still alive.
+        self._exit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+    
+    @property
+    def writer(self) -> CompressionWriter:
+        """The CompressionWriter, created when first needed."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    # Writes already happen on this logger's own thread, so
+                    # the writer does not need an event queue and flush
+                    # thread as well
+                    self._writer = _SyncCompressionWriter(logdir=self._logdir)
+                    self._owns_writer = True
+        return self._writer
+    
+    @writer.setter
+    def writer(self, writer: CompressionWriter) -> None:
+        # Pending epochs go to the old writer, not the new one. The thread
+        # is started again for the new writer, so the exit hook then runs
+        # before the new writer's own.
+        self._stop_thread()
+        with self._writer_lock:
+            if self._owns_writer:
+                self._writer.close()
+            self._writer = writer
+            self._owns_writer = False
+    
+    def _start_thread(self) -> None:
+        """Start the writer thread and register the exit hook."""
+        # Create the writer first: atexit runs hooks in reverse order of
+        # registration, so pending epochs are written before the writer's
+        # own hook closes its event file.
+        self.writer
+        self._thread = threading.Thread(
+            target=self._drain, name='TrainingLoggerWriter', daemon=True)
+        self._thread.start()
+        atexit.register(self._exit_hook)
+    
+    def _stop_thread(self) -> None:
+        """Write every pending epoch, then stop the writer thread."""
+        if self._thread is None:
+            return
+        atexit.unregister(self._exit_hook)
+        self._hand_off()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
     
     def log_epoch(
         self,
@@ -70,6 +205,10 @@ class TrainingLogger:
     ) -> None:
         """Log metrics for a single training epoch.
         
+        Loss, accuracy and F1 are also logged as ``{model_name}/loss/train``,
+        ``{model_name}/loss/val`` and so on, so the scalar dashboard groups
+        each train/val pair into one section by tag prefix.
+        
         Args:
             epoch: Current epoch number
             train_loss: Training loss
@@ -84,52 +223,199 @@ class TrainingLogger:
             val_specificity: Validation specificity (optional)
             learning_rate: Current learning rate (optional)
         """
-        # Log training metrics
-        self.writer.add_scalar(f'{self.model_name}/training/loss', train_loss, epoch)
-        self.writer.add_scalar(f'{self.model_name}/training/accuracy', train_acc, epoch)
-        self.writer.add_scalar(f'{self.model_name}/training/f1_score', train_f1, epoch)
-        
-        # Log validation metrics
-        self.writer.add_scalar(f'{self.model_name}/validation/loss', val_loss, epoch)
-        self.writer.add_scalar(f'{self.model_name}/validation/accuracy', val_acc, epoch)
-        self.writer.add_scalar(f'{self.model_name}/validation/f1_score', val_f1, epoch)
-        
-        # Log training/validation comparison
-        self.writer.add_scalars(
-            f'{self.model_name}/loss',
-            {'train': train_loss, 'val': val_loss},
-            epoch
-        )
-        self.writer.add_scalars(
-            f'{self.model_name}/accuracy',
-            {'train': train_acc, 'val': val_acc},
-            epoch
-        )
-        self.writer.add_scalars(
-            f'{self.model_name}/f1_score',
-            {'train': train_f1, 'val': val_f1},
-            epoch
+        # All per-epoch scalars of this run go out as one Summary event
+        scalars = self._epoch_scalars(
+            train_loss, train_acc, train_f1, val_loss, val_acc, val_f1,
+            train_sensitivity, train_specificity, val_sensitivity,
+            val_specificity, learning_rate,
         )
-        
-        # Log sensitivity and specificity if provided
-        if train_sensitivity is not None:
-            self.writer.add_scalar(f'{self.model_name}/training/sensitivity', train_sensitivity, epoch)
-        if train_specificity is not None:
-            self.writer.add_scalar(f'{self.model_name}/training/specificity', train_specificity, epoch)
-        if val_sensitivity is not None:
-            self.writer.add_scalar(f'{self.model_name}/validation/sensitivity', val_sensitivity, epoch)
-        if val_specificity is not None:
-            self.writer.add_scalar(f'{self.model_name}/validation/specificity', val_specificity, epoch)
-        
-        # Log learning rate if provided
-        if learning_rate is not None:
-            self.writer.add_scalar(f'{self.model_name}/training/learning_rate', learning_rate, epoch)
+        self._buffer.append((epoch, time.time(), scalars))
+        if self._thread is None:
+            self._start_thread()
+        if len(self._buffer) >= self._log_every:
+            self.flush()
         
         # Track best validation F1
         if val_f1 > self.best_val_f1:
             self.best_val_f1 = val_f1
             self.best_epoch = epoch
     
+    def log_epochs_batch(
+        self,
+        epochs: Union[np.ndarray, list[int]],
+        train_loss: Union[np.ndarray, list[float]],
+        train_acc: Union[np.ndarray, list[float]],
+        train_f1: Union[np.ndarray, list[float]],
+        val_loss: Union[np.ndarray, list[float]],
+        val_acc: Union[np.ndarray, list[float]],
+        val_f1: Union[np.ndarray, list[float]],
+        train_sensitivity: Optional[Union[np.ndarray, list[float]]] = None,
+        train_specificity: Optional[Union[np.ndarray, list[float]]] = None,
+        val_sensitivity: Optional[Union[np.ndarray, list[float]]] = None,
+        val_specificity: Optional[Union[np.ndarray, list[float]]] = None,
+        learning_rate: Optional[Union[np.ndarray, list[float]]] = None
+    ) -> None:
+        """Log the metrics of several epochs at once.
+        
+        Equivalent to calling :meth:`log_epoch` for every index, with each
+        argument given as a 1-D array holding one value per epoch. The
+        arrays are converted once up front and the best validation F1 is
+        found with a single reduction.
+        
+        Raises:
+            ValueError: If the arrays do not all have the length of ``epochs``
+        """
+        epochs = np.asarray(epochs).reshape(-1).tolist()
+        n = len(epochs)
+        columns = []
+        for values in (
+            train_loss, train_acc, train_f1, val_loss, val_acc, val_f1,
+            train_sensitivity, train_specificity, val_sensitivity,
+            val_specificity, learning_rate,
+        ):
+            if values is None:
+                columns.append([None] * n)
+                continue
+            values = np.asarray(values, dtype=np.float64).reshape(-1)
+            if values.size != n:
+                raise ValueError(
+                    f'Expected {n} values per metric, got {values.size}.')
+            columns.append(values.tolist())
+        if not n:
+            return
+        
+        walltime = time.time()
+        epoch_scalars = self._epoch_scalars
+        buffer = self._buffer
+        for epoch, *row in zip(epochs, *columns):
+            buffer.append((epoch, walltime, epoch_scalars(*row)))
+        if self._thread is None:
+            self._start_thread()
+        if len(buffer) >= self._log_every:
+            self.flush()
+        
+        # Track best validation F1
+        best_val_f1, best = _best_index(columns[5])
+        if best >= 0 and best_val_f1 > self.best_val_f1:
+            self.best_val_f1 = best_val_f1
+            self.best_epoch = epochs[best]
+    
+    def _epoch_scalars(
+        self,
+        train_loss: float,
+        train_acc: float,
+        train_f1: float,
+        val_loss: float,
+        val_acc: float,
+        val_f1: float,
+        train_sensitivity: Optional[float],
+        train_specificity: Optional[float],
+        val_sensitivity: Optional[float],
+        val_specificity: Optional[float],
+        learning_rate: Optional[float]
+    ) -> list[tuple[str, float]]:
+        """Return the ``(tag, value)`` pairs logged for one epoch."""
+        tags = self._tags
+        scalars = [
+            # Training metrics
+            (tags['train_loss'], train_loss),
+            (tags['train_acc'], train_acc),
+            (tags['train_f1'], train_f1),
+            # Validation metrics
+            (tags['val_loss'], val_loss),
+            (tags['val_acc'], val_acc),
+            (tags['val_f1'], val_f1),
+            # Training/validation comparison, grouped by metric. These stay
+            # in this run rather than going through add_scalars, which opens
+            # a separate event file (and run) per sub-tag.
+            (tags['loss_train'], train_loss),
+            (tags['loss_val'], val_loss),
+            (tags['accuracy_train'], train_acc),
+            (tags['accuracy_val'], val_acc),
+            (tags['f1_score_train'], train_f1),
+            (tags['f1_score_val'], val_f1),
+        ]
+        
+        # Sensitivity, specificity and learning rate if provided
+        scalars.extend(
+            (tag, value) for tag, value in (
+                (tags['train_sensitivity'], train_sensitivity),
+                (tags['train_specificity'], train_specificity),
+                (tags['val_sensitivity'], val_sensitivity),
+                (tags['val_specificity'], val_specificity),
+                (tags['learning_rate'], learning_rate),
+            ) if value is not None
+        )
+        if self._unchanged_tolerance is not None:
+            scalars = self._drop_unchanged(scalars)
+        return scalars
+    
+    def _drop_unchanged(self, scalars: list[tuple[str, float]]) -> list[tuple[str, float]]:
+        """Filter out values within tolerance of the last written value."""
+        tolerance = self._unchanged_tolerance
+        force_write_every = self._force_write_every
+        last = self._last
+        kept = []
+        for tag, value in scalars:
+            state = last.get(tag)
+            # Skip at most force_write_every - 1 epochs in a row
+            if (
+                state is not None
+                and abs(value - state[0]) < tolerance
+                and state[1] + 1 < force_write_every
+            ):
+                state[1] += 1
+                continue
+            last[tag] = [value, 0]
+            kept.append((tag, value))
+        return kept
+    
+    def flush(self) -> None:
+        """Hand any buffered epochs to the writer thread, one event per epoch.
+
+        Blocks only while the write queue is full.
+
+        Raises:
+            Exception: The first error raised while writing earlier epochs
+        """
+        self._raise_error()
+        self._hand_off()
+    
+    def _hand_off(self) -> None:
+        buffer, self._buffer = self._buffer, []
+        for item in buffer:
+            self._queue.put(item)
+    
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                epoch, walltime, scalars = item
+                self.writer._add_scalars_bulk(scalars, epoch, walltime)
+                if self._queue.empty():
+                    # Nothing else pending: make the events visible now
+                    self.writer.flush()
+            except Exception as e:
+                logger.exception('Failed to write training metrics')
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
+    
+    def _wait(self) -> None:
+        """Write out every pending epoch before returning."""
+        self.flush()
+        self._queue.join()
+        self._raise_error()
+    
+    def _raise_error(self) -> None:
+        """Re-raise the first error of the writer thread, once."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
     def log_early_stopping(
         self,
         epoch: int,
@@ -139,20 +425,28 @@ class TrainingLogger:
     ) -> None:
         """Log early stopping information.
         
+        ``patience`` and ``min_delta`` are only written on the first call.
+        
         Args:
             epoch: Current epoch number
             patience: Patience parameter for early stopping
             min_delta: Minimum delta for improvement
             stopped: Whether early stopping was triggered
         """
-        # Log early stopping parameters
-        self.writer.add_scalar(f'{self.model_name}/training/early_stopping_patience', patience, epoch)
-        self.writer.add_scalar(f'{self.model_name}/training/early_stopping_min_delta', min_delta, epoch)
-        self.writer.add_scalar(f'{self.model_name}/training/early_stopped', 1 if stopped else 0, epoch)
+        # Keep the event file in step order
+        self._wait()
+        
+        # Early stopping parameters are fixed for a run, so they are only
+        # logged on the first call
+        if not self._es_params_logged:
+            self.writer.add_scalar(self._tags['early_stopping_patience'], patience, epoch)
+            self.writer.add_scalar(self._tags['early_stopping_min_delta'], min_delta, epoch)
+            self._es_params_logged = True
+        self.writer.add_scalar(self._tags['early_stopped'], 1 if stopped else 0, epoch)
         
         # Log best epoch information
-        self.writer.add_scalar(f'{self.model_name}/training/best_epoch', self.best_epoch, epoch)
-        self.writer.add_scalar(f'{self.model_name}/training/best_val_f1', self.best_val_f1, epoch)
+        self.writer.add_scalar(self._tags['best_epoch'], self.best_epoch, epoch)
+        self.writer.add_scalar(self._tags['best_val_f1'], self.best_val_f1, epoch)
     
     def log_training_summary(
         self,
@@ -163,10 +457,17 @@ class TrainingLogger:
         final_val_loss: float,
         final_val_acc: float,
         final_val_f1: float,
-        early_stopped: bool = False
+        early_stopped: bool = False,
+        emit_final_scalars: bool = False
     ) -> None:
         """Log training summary at the end of training.
         
+        The run configuration and outcome (total epochs, early stopping, best
+        epoch and validation F1) are written as an HParams session, so
+        finished runs can be compared in the HParams dashboard. Its metric
+        columns are the per-epoch training and validation curves, which the
+        dashboard reads at their last logged epoch.
+        
         Args:
             total_epochs: Total number of epochs trained
             final_train_loss: Final training loss
@@ -176,35 +477,64 @@ class TrainingLogger:
             final_val_acc: Final validation accuracy
             final_val_f1: Final validation F1 score
             early_stopped: Whether training was stopped early
+            emit_final_scalars: Also write the final values as separate
+                ``final_*`` scalars at step ``total_epochs + 1``, which then
+                become the session's metrics (default: False, since they
+                repeat the values of the last epoch)
         """
-        summary_text = f"Training Summary for {self.model_name}\n"
-        summary_text += f"Total Epochs: {total_epochs}\n"
-        summary_text += f"Early Stopped: {early_stopped}\n"
-        summary_text += f"Best Epoch: {self.best_epoch}\n"
-        summary_text += f"Best Val F1: {self.best_val_f1:.4f}\n"
-        summary_text += f"\nFinal Training Metrics:\n"
-        summary_text += f"  Loss: {final_train_loss:.4f}\n"
-        summary_text += f"  Accuracy: {final_train_acc:.4f}\n"
-        summary_text += f"  F1 Score: {final_train_f1:.4f}\n"
-        summary_text += f"\nFinal Validation Metrics:\n"
-        summary_text += f"  Loss: {final_val_loss:.4f}\n"
-        summary_text += f"  Accuracy: {final_val_acc:.4f}\n"
-        summary_text += f"  F1 Score: {final_val_f1:.4f}\n"
-        
-        self.writer.add_text(f'{self.model_name}/training/summary', summary_text, total_epochs)
-        
-        # Log final metrics at a special step
+        self._wait()
+        
+        tags = self._tags
+        if emit_final_scalars:
+            final_metrics = {
+                tags['final_train_loss']: final_train_loss,
+                tags['final_train_acc']: final_train_acc,
+                tags['final_train_f1']: final_train_f1,
+                tags['final_val_loss']: final_val_loss,
+                tags['final_val_acc']: final_val_acc,
+                tags['final_val_f1']: final_val_f1,
+            }
+        else:
+            final_metrics = {
+                tags['train_loss']: final_train_loss,
+                tags['train_acc']: final_train_acc,
+                tags['train_f1']: final_train_f1,
+                tags['val_loss']: final_val_loss,
+                tags['val_acc']: final_val_acc,
+                tags['val_f1']: final_val_f1,
+            }
+        summary = Summary()
+        for part in hparams(
+            {
+                'model_name': self.model_name,
+                'total_epochs': total_epochs,
+                'early_stopped': early_stopped,
+                'best_epoch': self.best_epoch,
+                'best_val_f1': self.best_val_f1,
+            },
+            final_metrics,
+        ):
+            summary.value.extend(part.value)
+        
+        # The session (and the final scalars, if requested) go out as one
+        # event, at a special step after the last epoch
         final_step = total_epochs + 1
-        self.writer.add_scalar(f'{self.model_name}/training/final_train_loss', final_train_loss, final_step)
-        self.writer.add_scalar(f'{self.model_name}/training/final_train_acc', final_train_acc, final_step)
-        self.writer.add_scalar(f'{self.model_name}/training/final_train_f1', final_train_f1, final_step)
-        self.writer.add_scalar(f'{self.model_name}/validation/final_val_loss', final_val_loss, final_step)
-        self.writer.add_scalar(f'{self.model_name}/validation/final_val_acc', final_val_acc, final_step)
-        self.writer.add_scalar(f'{self.model_name}/validation/final_val_f1', final_val_f1, final_step)
+        self.writer._add_scalars_bulk(
+            list(final_metrics.items()) if emit_final_scalars else [],
+            final_step,
+            summary=summary,
+        )
     
     def close(self) -> None:
-        """Close the writer and flush all pending writes."""
-        self.writer.close()
+        """Close the writer and flush all pending writes.
+
+        Raises:
+            Exception: The first error raised while writing epochs
+        """
+        self._stop_thread()
+        if self._writer is not None:
+            self._writer.close()
+        self._raise_error()
     
     def __enter__(self):
         """Context manager entry."""
@@ -215,15 +545,47 @@ class TrainingLogger:
         self.close()
 
 
+def _close_at_exit(logger_ref: weakref.ref) -> None:
+    """atexit hook closing a TrainingLogger that is still alive."""
+    training_logger = logger_ref()
+    if training_logger is not None:
+        training_logger.close()
+
+
+def _best_index(values: Union[np.ndarray, list[float]]) -> tuple[float, int]:
+    """Return ``(best, index)`` of the first maximum of ``values``.
+
+    NaNs are skipped, matching the ``>`` comparison of :meth:`TrainingLogger.log_epoch`;
+    the index is -1 if there is no non-NaN value.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return float('-inf'), -1
+    masked = np.where(np.isnan(values), -np.inf, values)
+    index = int(np.argmax(masked))
+    if np.isnan(values[index]):
+        return float('-inf'), -1
+    return float(values[index]), index
+
+
 def create_training_logger(
     model_name: str,
-    logdir: Optional[str] = None
+    logdir: Optional[str] = None,
+    log_every: int = 1,
+    unchanged_tolerance: Optional[float] = None,
+    force_write_every: int = 10
 ) -> TrainingLogger:
     """Convenience function to create a TrainingLogger.
     
     Args:
         model_name: Name of the model being trained
         logdir: Directory for TensorBoard logs (default: runs/training/{model_name})
+        log_every: Number of epochs buffered before writing (default: 1);
+            call ``close()`` to write the last, partial batch
+        unchanged_tolerance: Skip metrics within this of their last written
+            value (default: None, write every value)
+        force_write_every: Write each metric at least every this many
+            epochs, even if unchanged (default: 10)
         
     Returns:
         TrainingLogger instance
@@ -234,5 +596,11 @@ def create_training_logger(
         >>> logger.log_epoch(0, 0.5, 0.9, 0.85, 0.4, 0.92, 0.87)
         >>> logger.close()
     """
-    return TrainingLogger(model_name, logdir=logdir)
+    return TrainingLogger(
+        model_name,
+        logdir=logdir,
+        log_every=log_every,
+        unchanged_tolerance=unchanged_tolerance,
+        force_write_every=force_write_every,
+    )
 
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Compression-specific TensorBoard writer for model compression visualization.
+
+This module provides a CompressionWriter class that extends SummaryWriter
+with compression-specific logging methods for FP32 vs INT8 comparisons,
+compression ratios, and model metadata.
+"""
+
+import math
+import os
+import struct
+import time
+from collections.abc import Set
+from typing import Optional, Union
+
+import numpy as np
+
+from ..event_file_writer import EventsWriter
+from ..proto.event_pb2 import Event, SessionLog
+from ..proto.summary_pb2 import Summary
+from ..record_writer import directory_check
+from ..summary import _clean_tag
+from ..writer import FileWriter, SummaryWriter
+
+# Number of buckets shared by the FP32 and INT8 latency histograms.
+_LATENCY_HISTOGRAM_BINS = 64
+# FP32 and INT8 tag suffixes of the latency histograms. Tags are built as
+# ``model_name + suffix``.
+_LATENCY_DISTRIBUTION_TAGS = ("/latency_distribution/fp32", "/latency_distribution/int8")
+
+# (metric key, FP32 tag suffix, INT8 tag suffix) for the side-by-side
+# comparison, in logging order. Tags are built as ``model_name + suffix``.
+_COMPARISON_TAGS = (
+    ("accuracy", "/metrics/accuracy/fp32", "/metrics/accuracy/int8"),
+    ("f1_score", "/metrics/f1_score/fp32", "/metrics/f1_score/int8"),
+    ("latency_mean_ms", "/performance/latency_ms/fp32", "/performance/latency_ms/int8"),
+    ("model_size_mb", "/performance/model_size_mb/fp32", "/performance/model_size_mb/int8"),
+    ("memory_usage_mb", "/performance/memory_usage_mb/fp32", "/performance/memory_usage_mb/int8"),
+    ("loss", "/metrics/loss/fp32", "/metrics/loss/int8"),
+)
+
+
+class CompressionWriter(SummaryWriter):
+    """Specialized SummaryWriter for compression metrics visualization.
+    
+    Extends SummaryWriter with compression-specific methods for logging
+    FP32 vs INT8 comparisons, compression ratios, speedups, and model metadata.
+    Uses hierarchical tag structure optimized for compression analysis.
+    
+    Example:
+        >>> writer = CompressionWriter('runs/compression')
+        >>> writer.log_compression_comparison('alexnet', fp32_metrics, int8_metrics)
+        >>> writer.log_compression_ratios('alexnet', fp32_metrics, int8_metrics)
+        >>> writer.close()
+    """
+
+    def _add_scalars_bulk(
+        self,
+        tag_values: list[tuple[str, Union[float, int]]],
+        step: Optional[int] = None,
+        walltime: Optional[float] = None,
+        summary: Optional[Summary] = None,
+    ) -> None:
+        """Log many scalars as the values of a single ``Summary`` event.
+
+        Equivalent to calling :meth:`add_scalar` for each ``(tag, value)``
+        pair, but builds one protobuf and takes the event-writer queue once.
+        Unlike :meth:`add_scalars`, every value stays in this writer's run.
+
+        Args:
+            tag_values: List of ``(tag, value)`` pairs
+            step: Global step for logging
+            walltime: Optional override of the event wall time
+            summary: Optional ``Summary`` (e.g. from ``summary.text``) that
+                the scalar values are appended to and written with
+        """
+        if summary is None:
+            if not tag_values:
+                return
+            summary = Summary()
+        summary.value.extend(
+            Summary.Value(tag=_clean_tag(tag), simple_value=float(value))
+            for tag, value in tag_values
+        )
+        self._get_file_writer().add_summary(summary, step, walltime)
+        comet_logger = self._get_comet_logger()
+        for tag, value in tag_values:
+            comet_logger.log_metric(tag, "", value, step)
+    
+    def log_compression_comparison(
+        self,
+        model_name: str,
+        fp32_metrics: dict[str, Union[float, int]],
+        int8_metrics: dict[str, Union[float, int]],
+        step: int = 0,
+        common_keys: Optional[Set[str]] = None,
+    ) -> None:
+        """Log FP32 vs INT8 metrics side-by-side for comparison.
+
+        NOTE: We intentionally avoid :meth:`add_scalars` here, since
+        tensorboardX implements it by creating a new ``FileWriter`` per
+        sub-tag, which shows up in TensorBoard as multiple *runs*. For
+        compression benchmarks we want one run per model, so all values
+        are written with fully-qualified tag names as one event through
+        :meth:`_add_scalars_bulk`.
+
+        ``common_keys`` is the set of metric names present in both dicts; it
+        is computed when not given, and callers logging several groups for
+        the same model can compute it once and pass it along.
+        """
+        if common_keys is None:
+            common_keys = fp32_metrics.keys() & int8_metrics.keys()
+        scalars = []
+        append = scalars.append
+
+        for key, fp32_suffix, int8_suffix in _COMPARISON_TAGS:
+            if key in common_keys:
+                append((model_name + fp32_suffix, fp32_metrics[key]))
+                append((model_name + int8_suffix, int8_metrics[key]))
+
+        self._add_scalars_bulk(scalars, step)
+    
+    def log_compression_ratios(
+        self,
+        model_name: str,
+        fp32_metrics: dict[str, Union[float, int]],
+        int8_metrics: dict[str, Union[float, int]],
+        step: int = 0,
+        common_keys: Optional[Set[str]] = None,
+    ) -> None:
+        """Calculate and log compression ratios (size, latency, memory).
+        
+        Args:
+            model_name: Name of the model
+            fp32_metrics: Dictionary of FP32 metrics
+            int8_metrics: Dictionary of INT8 metrics
+            step: Global step for logging (default: 0)
+            common_keys: Metric names present in both dicts (computed if None)
+        """
+        if common_keys is None:
+            common_keys = fp32_metrics.keys() & int8_metrics.keys()
+        scalars = []
+        append = scalars.append
+
+        # Size compression ratio
+        if "model_size_mb" in common_keys:
+            fp32_size = fp32_metrics["model_size_mb"]
+            int8_size = int8_metrics["model_size_mb"]
+            if int8_size > 0:
+                size_ratio = fp32_size / int8_size
+                append((model_name + "/compression/size_ratio", size_ratio))
+                
+                # Size reduction percentage
+                size_reduction = ((fp32_size - int8_size) / fp32_size) * 100
+                append((
+                    model_name + "/compression/size_reduction_pct",
+                    size_reduction,
+                ))
+        
+        # Latency speedup
+        if "latency_mean_ms" in common_keys:
+            fp32_latency = fp32_metrics["latency_mean_ms"]
+            int8_latency = int8_metrics["latency_mean_ms"]
+            if int8_latency > 0:
+                speedup = fp32_latency / int8_latency
+                append((model_name + "/compression/speedup", speedup))
+        
+        # Memory reduction
+        if "memory_usage_mb" in common_keys:
+            fp32_memory = fp32_metrics["memory_usage_mb"]
+            int8_memory = int8_metrics["memory_usage_mb"]
+            memory_reduction = fp32_memory - int8_memory
+            append((
+                model_name + "/compression/memory_reduction_mb",
+                memory_reduction,
+            ))
+        
+        # Accuracy drop
+        if "accuracy" in common_keys:
+            accuracy_drop = fp32_metrics["accuracy"] - int8_metrics["accuracy"]
+            append((model_name + "/compression/accuracy_drop", accuracy_drop))
+            
+            # Accuracy retention percentage
+            if fp32_metrics["accuracy"] > 0:
+                accuracy_retention = (
+                    int8_metrics["accuracy"] / fp32_metrics["accuracy"]
+                ) * 100
+                append((
+                    model_name + "/compression/accuracy_retention_pct",
+                    accuracy_retention,
+                ))
+
+        self._add_scalars_bulk(scalars, step)
+    
+    def log_model_metadata(
+        self,
+        model_name: str,
+        model_info: dict[str, Union[str, list]],
+        step: int = 0
+    ) -> None:
+        """Log model metadata (library, category, input shape, description).
+        
+        Args:
+            model_name: Name of the model
+            model_info: Dictionary containing model metadata
+            step: Global step for logging (default: 0)
+        """
+        add = self.add_scalar
+
+        # Log metadata as text summary
+        metadata_text = f"Model: {model_name}\n"
+        
+        if "library" in model_info:
+            metadata_text += f"Library: {model_info['library']}\n"
+        
+        if "category" in model_info:
+            metadata_text += f"Category: {model_info['category']}\n"
+        
+        if "description" in model_info:
+            metadata_text += f"Description: {model_info['description']}\n"
+        
+        if "input_shape" in model_info:
+            input_shape = model_info["input_shape"]
+            metadata_text += f"Input Shape: {input_shape}\n"
+            # Log input shape dimensions as scalars
+            if isinstance(input_shape, list) and len(input_shape) > 0:
+                add(
+                    model_name + "/metadata/input_channels", input_shape[0], step
+                )
+                if len(input_shape) > 1:
+                    add(
+                        model_name + "/metadata/input_height", input_shape[1], step
+                    )
+                if len(input_shape) > 2:
+                    add(
+                        model_name + "/metadata/input_width", input_shape[2], step
+                    )
+        
+        self.add_text(model_name + '/metadata/info', metadata_text, step)
+    
+    def log_energy_comparison(
+        self,
+        model_name: str,
+        fp32_metrics: dict[str, Union[float, int]],
+        int8_metrics: dict[str, Union[float, int]],
+        step: int = 0,
+        common_keys: Optional[Set[str]] = None,
+    ) -> None:
+        """Log energy consumption comparison between FP32 and INT8.
+        
+        Args:
+            model_name: Name of the model
+            fp32_metrics: Dictionary of FP32 metrics
+            int8_metrics: Dictionary of INT8 metrics
+            step: Global step for logging (default: 0)
+            common_keys: Metric names present in both dicts (computed if None)
+        """
+        if common_keys is None:
+            common_keys = fp32_metrics.keys() & int8_metrics.keys()
+        scalars = []
+        append = scalars.append
+        if "energy_consumption_mw" in common_keys:
+            append((
+                model_name + "/performance/energy_mw/fp32",
+                fp32_metrics["energy_consumption_mw"],
+            ))
+            append((
+                model_name + "/performance/energy_mw/int8",
+                int8_metrics["energy_consumption_mw"],
+            ))
+            
+            # Energy reduction
+            energy_reduction = (
+                fp32_metrics["energy_consumption_mw"]
+                - int8_metrics["energy_consumption_mw"]
+            )
+            append((
+                model_name + "/compression/energy_reduction_mw",
+                energy_reduction,
+            ))
+            
+            # Energy efficiency ratio
+            if int8_metrics["energy_consumption_mw"] > 0:
+                energy_ratio = (
+                    fp32_metrics["energy_consumption_mw"]
+                    / int8_metrics["energy_consumption_mw"]
+                )
+                append((
+                    model_name + "/compression/energy_ratio",
+                    energy_ratio,
+                ))
+
+        self._add_scalars_bulk(scalars, step)
+    
+    def log_latency_distribution(
+        self,
+        model_name: str,
+        fp32_latencies: np.ndarray,
+        int8_latencies: np.ndarray,
+        step: int = 0
+    ) -> None:
+        """Log latency distribution histograms for FP32 and INT8.
+        
+        Both histograms are binned over the same bucket edges, spanning the
+        combined latency range, so the two distributions line up directly in
+        TensorBoard.
+        
+        Args:
+            model_name: Name of the model
+            fp32_latencies: Array of FP32 latency measurements
+            int8_latencies: Array of INT8 latency measurements
+            step: Global step for logging (default: 0)
+        """
+        fp32_latencies = np.asarray(fp32_latencies, dtype=np.float64).reshape(-1)
+        int8_latencies = np.asarray(int8_latencies, dtype=np.float64).reshape(-1)
+        if fp32_latencies.size == 0 or int8_latencies.size == 0:
+            raise ValueError('The input has no element.')
+
+        lo = min(fp32_latencies.min(), int8_latencies.min())
+        hi = max(fp32_latencies.max(), int8_latencies.max())
+        edges = np.histogram_bin_edges((lo, hi), bins=_LATENCY_HISTOGRAM_BINS)
+
+        for suffix, latencies in zip(_LATENCY_DISTRIBUTION_TAGS, (fp32_latencies, int8_latencies)):
+            counts, _ = np.histogram(latencies, bins=edges)
+            self.add_histogram_raw(
+                model_name + suffix,
+                min=latencies.min(),
+                max=latencies.max(),
+                num=latencies.size,
+                sum=latencies.sum(),
+                sum_squares=latencies.dot(latencies),
+                bucket_limits=edges[1:].tolist(),
+                bucket_counts=counts.tolist(),
+                global_step=step,
+            )
+
+
+class _SyncEventFileWriter:
+    """Drop-in for ``EventFileWriter`` that writes on the calling thread.
+
+    ``EventFileWriter`` starts a queue and a flush thread per event file,
+    which is wasted work when the caller writes a few events and closes the
+    file straight away, or already writes from a thread of its own.
+    """
+
+    def __init__(self, logdir: str, filename_suffix: str = ''):
+        self._logdir = logdir
+        self._filename_suffix = filename_suffix
+        directory_check(self._logdir)
+        self._ev_writer = EventsWriter(os.path.join(self._logdir, "events"), filename_suffix)
+        self._closed = False
+
+    def get_logdir(self) -> str:
+        """Returns the directory where event file will be written."""
+        return self._logdir
+
+    def add_event(self, event) -> None:
+        if not self._closed:
+            self._ev_writer.write_event(event)
+
+    def add_serialized_event(self, data: bytes) -> None:
+        if not self._closed:
+            self._ev_writer._write_serialized_event(data)
+
+    def flush(self) -> None:
+        if not self._closed:
+            self._ev_writer.flush()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._ev_writer.close()
+            self._closed = True
+
+    def reopen(self) -> None:
+        if self._closed:
+            self._ev_writer = EventsWriter(
+                os.path.join(self._logdir, "events"), self._filename_suffix)
+            self._closed = False
+
+
+class _SyncFileWriter(FileWriter):
+    """``FileWriter`` backed by a :class:`_SyncEventFileWriter`."""
+
+    def __init__(self, logdir: str, filename_suffix: str = ''):
+        super().__init__(logdir, filename_suffix=filename_suffix)
+
+    def _create_event_writer(self, logdir, max_queue, flush_secs, filename_suffix):
+        return _SyncEventFileWriter(logdir, filename_suffix)
+
+    def add_serialized_summary(
+        self,
+        summary: bytes,
+        global_step: Optional[int] = None,
+        walltime: Optional[float] = None,
+    ) -> None:
+        """Like :meth:`add_summary`, for an already serialized ``Summary``."""
+        event = Event()
+        walltime = (
+            self._default_metadata.get("walltime", time.time())
+            if walltime is None
+            else walltime
+        )
+        if walltime is not None:
+            event.wall_time = walltime
+        step = self._default_metadata.get("global_step") if global_step is None else global_step
+        if step is not None:
+            event.step = int(step)
+        self.event_writer.add_serialized_event(
+            event.SerializeToString() + _EVENT_SUMMARY_KEY + _varint(len(summary)) + summary)
+
+
+class _SyncCompressionWriter(CompressionWriter):
+    """CompressionWriter that writes its events on the calling thread.
+
+    Used where the caller already controls when writes happen: the per-model
+    runs of ``BenchmarkParser.log_benchmark_results``, which are closed right
+    after their model is logged, and ``TrainingLogger``, which writes from its
+    own background thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Serialized Summary.Value prefixes by tag, see _scalar_value_prefix
+        self._scalar_prefixes: dict[str, bytes] = {}
+        super().__init__(*args, **kwargs)
+
+    def _get_file_writer(self):
+        if not self._write_to_disk:
+            return super()._get_file_writer()
+
+        if self.all_writers is None or self.file_writer is None:
+            self.file_writer = _SyncFileWriter(self.logdir, self._filename_suffix)
+            if self.purge_step is not None:
+                self.file_writer.add_event(
+                    Event(step=self.purge_step, file_version='brain.Event:2'))
+                self.file_writer.add_event(
+                    Event(step=self.purge_step, session_log=SessionLog(status=SessionLog.START)))
+            self.all_writers = {self.file_writer.get_logdir(): self.file_writer}
+        return self.file_writer
+
+    def _add_scalars_bulk(
+        self,
+        tag_values: list[tuple[str, Union[float, int]]],
+        step: Optional[int] = None,
+        walltime: Optional[float] = None,
+        summary: Optional[Summary] = None,
+    ) -> None:
+        """Same as :meth:`CompressionWriter._add_scalars_bulk`.
+
+        Scalar-only summaries are serialized directly: each tag's encoded
+        ``Summary.Value`` up to the float payload is cached, so writing a
+        value only appends its four float bytes.
+        """
+        if summary is not None or not tag_values or not self._write_to_disk:
+            super()._add_scalars_bulk(tag_values, step, walltime, summary)
+            return
+        prefixes = self._scalar_prefixes
+        parts = []
+        for tag, value in tag_values:
+            prefix = prefixes.get(tag)
+            if prefix is None:
+                prefix = prefixes[tag] = _scalar_value_prefix(tag)
+            parts.append(prefix)
+            parts.append(_float32_bytes(value))
+        self._get_file_writer().add_serialized_summary(b''.join(parts), step, walltime)
+        comet_logger = self._get_comet_logger()
+        for tag, value in tag_values:
+            comet_logger.log_metric(tag, "", value, step)
+
+
+# Key of Event.summary (field 5, length-delimited) in the wire format.
+_EVENT_SUMMARY_KEY = b'\x2a'
+# Key of Summary.value (field 1, length-delimited) in the wire format.
+_SUMMARY_VALUE_KEY = b'\x0a'
+_FLOAT32 = struct.Struct('<f')
+
+
+def _varint(n: int) -> bytes:
+    """Protobuf base-128 varint encoding of a non-negative int."""
+    out = bytearray()
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _scalar_value_prefix(tag: str) -> bytes:
+    """Encoded ``Summary.value`` entry for ``tag``, minus the float payload.
+
+    The entry ends with ``simple_value`` (a fixed32 field), so appending the
+    value's four little-endian float bytes completes it.
+    """
+    value = Summary.Value(tag=_clean_tag(tag), simple_value=1.0).SerializeToString()
+    return _SUMMARY_VALUE_KEY + _varint(len(value)) + value[:-4]
+
+
+def _float32_bytes(value: Union[float, int]) -> bytes:
+    """Little-endian float32 bytes, saturating to +/-inf like protobuf does."""
+    try:
+        return _FLOAT32.pack(value)
+    except OverflowError:
+        return _FLOAT32.pack(math.copysign(math.inf, value))
@@ -115,15 +115,18 @@ class FileWriter:
         # TODO: See if we can remove this in the future if we are
         # actually the ones passing in a PosixPath
         logdir = str(logdir)
-        self.event_writer = EventFileWriter(
+        self.event_writer = self._create_event_writer(
             logdir, max_queue, flush_secs, filename_suffix)
 
-        def cleanup():
-            self.event_writer.close()
-
-        atexit.register(cleanup)
+        # Registered as the event writer's bound method, so the hook does
+        # not keep this FileWriter alive, and close() can unregister it.
+        atexit.register(self.event_writer.close)
         self._default_metadata = {}
 
+    def _create_event_writer(self, logdir, max_queue, flush_secs, filename_suffix):
+        """Returns the event writer backing this `FileWriter`."""
+        return EventFileWriter(logdir, max_queue, flush_secs, filename_suffix)
+
     def get_logdir(self):
         """Returns the directory where event file will be written."""
         return self.event_writer.get_logdir()
@@ -218,6 +221,7 @@ class FileWriter:
         Call this method when you do not need the summary writer anymore.
         """
         self.event_writer.close()
+        atexit.unregister(self.event_writer.close)
 
     def reopen(self):
         """Reopens the EventFileWriter.
@@ -226,6 +230,8 @@ class FileWriter:
         Does nothing if the EventFileWriter was not closed.
         """
         self.event_writer.reopen()
+        atexit.unregister(self.event_writer.close)
+        atexit.register(self.event_writer.close)
 
     @contextlib.contextmanager
     def use_metadata(self, *, global_step=None, walltime=None):
@@ -1,22 +1,51 @@
 #!/usr/bin/env python3
 """Test script to debug the compression plugin."""
 
+import argparse
+import json
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from tensorboard.backend.event_processing import event_multiplexer as em
-from compression_board_plugin.compression_board_plugin.compression_plugin import CompressionPlugin
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+from compression_board_plugin.compression_board_plugin.compression_plugin import (
+    CompressionPlugin,
+)
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument('logdir', nargs='?',
+                    default='runs/compression_benchmark/all_models_benchmark_100epochs_SANITYCHECK')
+parser.add_argument('--watch', type=float, metavar='SECONDS',
+                    help='keep reloading at this interval and report summary changes')
+args = parser.parse_args()
+
 
-# Build multiplexer
-m = em.EventMultiplexer()
-m.AddRunsFromDirectory('runs/compression_benchmark/all_models_benchmark_100epochs_SANITYCHECK')
-m.Reload()
+def reload_runs(multiplexer):
+    """Reload every run's accumulator in parallel.
+
+    EventMultiplexer.Reload() walks the runs one by one, but the runs are
+    independent event files.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda run: multiplexer.GetAccumulator(run).Reload(), multiplexer.Runs()))
+
+
+# Build multiplexer. Each accumulator remembers its read offset in every
+# event file, so later reloads only read events appended since.
+m = em.EventMultiplexer(purge_orphaned_data=False)
+m.AddRunsFromDirectory(args.logdir)
+reload_runs(m)
 
 class Ctx:
     def __init__(self):
         self.multiplexer = m
-        self.logdir = 'runs/compression_benchmark/all_models_benchmark_100epochs_SANITYCHECK'
+        self.logdir = args.logdir
 
 ctx = Ctx()
 plugin = CompressionPlugin(ctx)
@@ -25,26 +54,37 @@ print("is_active:", plugin.is_active())
 print()
 
 # Test the summary endpoint
-class Req:
-    pass
-
-req = Req()
+etag = None
 try:
-    resp = plugin._serve_summary(req)
-    print("Response type:", type(resp))
-    if hasattr(resp, 'data'):
-        import json
-        data = json.loads(resp.data)
-        print("Models found:", len(data.get('models', [])))
-        if data.get('error'):
-            print("ERROR:", data['error'])
-            if 'traceback' in data:
-                print("\nTraceback:")
-                print(data['traceback'])
-        else:
-            print("First model:", data['models'][0] if data['models'] else None)
+    environ = EnvironBuilder(path='/api/summary').get_environ()
+    body, status, headers = run_wsgi_app(plugin._serve_summary, environ, buffered=True)
+    while status.startswith('202'):
+        # The first snapshot is still being built
+        time.sleep(float(headers.get('Retry-After', 1)))
+        body, status, headers = run_wsgi_app(plugin._serve_summary, environ, buffered=True)
+    print("Response status:", status)
+    etag = headers.get('ETag')
+    data = json.loads(b''.join(body))
+    print("Runs found:", len(data.get('runs', [])))
+    if data.get('error'):
+        print("ERROR:", data['error'])
+    else:
+        print("First run:", data['runs'][0] if data['runs'] else None)
 except Exception as e:
     import traceback
     print("EXCEPTION:", e)
     traceback.print_exc()
 
+# Poll like the dashboard does: reload incrementally and only report when
+# the summary ETag changes.
+while args.watch:
+    time.sleep(args.watch)
+    m.AddRunsFromDirectory(args.logdir)
+    reload_runs(m)
+    environ = EnvironBuilder(
+        path='/api/summary', headers={'If-None-Match': etag} if etag else None).get_environ()
+    body, status, headers = run_wsgi_app(plugin._serve_summary, environ, buffered=True)
+    if status.startswith(('202', '304')):
+        continue
+    etag = headers.get('ETag')
+    print("Summary changed:", len(json.loads(b''.join(body)).get('runs', [])), "runs")
@@ -0,0 +1,394 @@
+import gc
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import weakref
+
+import numpy as np
+from tensorboard.backend.event_processing import event_accumulator
+
+from tensorboardX.compression import BenchmarkParser, CompressionWriter, TrainingLogger
+from tensorboardX.compression.benchmark import _hparam_metrics
+from tensorboardX.compression.training import _best_index
+from tensorboardX.compression.writer import _SyncCompressionWriter
+
+FP32 = {
+    'accuracy': 0.9,
+    'f1_score': 0.88,
+    'latency_mean_ms': 8.0,
+    'model_size_mb': 40.0,
+    'memory_usage_mb': 100.0,
+    'energy_consumption_mw': 5.0,
+    'sensitivity': 0.7,
+    'evaluated_on': 'gpu',
+}
+INT8 = {
+    'accuracy': 0.85,
+    'f1_score': 0.84,
+    'latency_mean_ms': 2.0,
+    'model_size_mb': 10.0,
+    'memory_usage_mb': 30.0,
+    'energy_consumption_mw': 4.0,
+    'sensitivity': 0.65,
+}
+
+
+def _scalars(logdir):
+    acc = event_accumulator.EventAccumulator(logdir)
+    acc.Reload()
+    return {tag: acc.Scalars(tag)[-1] for tag in acc.Tags()['scalars']}
+
+
+def _run_without_close(logdir, log_every, epochs):
+    """Log ``epochs`` epochs in a child interpreter that never calls close()."""
+    code = (
+        'import sys\n'
+        'from tensorboardX.compression import TrainingLogger\n'
+        'logger = TrainingLogger("alexnet", logdir=sys.argv[1], log_every=int(sys.argv[2]))\n'
+        'for epoch in range(int(sys.argv[3])):\n'
+        '    logger.log_epoch(epoch, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)\n'
+    )
+    subprocess.run(
+        [sys.executable, '-c', code, logdir, str(log_every), str(epochs)],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    acc = event_accumulator.EventAccumulator(logdir)
+    acc.Reload()
+    return [s.step for s in acc.Scalars('alexnet/training/loss')]
+
+
+class CompressionWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir)
+
+    def test_log_compression_metrics(self):
+        with CompressionWriter(self.logdir) as writer:
+            writer.log_compression_comparison('alexnet', FP32, INT8, step=3)
+            writer.log_compression_ratios('alexnet', FP32, INT8, step=3)
+            writer.log_energy_comparison('alexnet', FP32, INT8, step=3)
+        scalars = _scalars(self.logdir)
+        self.assertAlmostEqual(scalars['alexnet/metrics/accuracy/fp32'].value, 0.9, places=5)
+        self.assertAlmostEqual(scalars['alexnet/performance/latency_ms/int8'].value, 2.0)
+        self.assertAlmostEqual(scalars['alexnet/compression/size_ratio'].value, 4.0)
+        self.assertAlmostEqual(scalars['alexnet/compression/speedup'].value, 4.0)
+        self.assertAlmostEqual(scalars['alexnet/compression/memory_reduction_mb'].value, 70.0)
+        self.assertAlmostEqual(scalars['alexnet/compression/energy_ratio'].value, 1.25)
+        self.assertNotIn('alexnet/metrics/loss/fp32', scalars)
+        self.assertEqual({s.step for s in scalars.values()}, {3})
+
+    def test_log_latency_distribution(self):
+        fp32 = np.random.RandomState(0).normal(8.0, 1.0, 1000)
+        int8 = np.random.RandomState(1).normal(2.0, 0.5, 500)
+        with CompressionWriter(self.logdir) as writer:
+            writer.log_latency_distribution('alexnet', fp32, int8, step=1)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        fp32_hist = acc.Histograms('alexnet/latency_distribution/fp32')[0].histogram_value
+        int8_hist = acc.Histograms('alexnet/latency_distribution/int8')[0].histogram_value
+        self.assertEqual(fp32_hist.bucket_limit, int8_hist.bucket_limit)
+        self.assertEqual(sum(fp32_hist.bucket), 1000)
+        self.assertEqual(sum(int8_hist.bucket), 500)
+        self.assertAlmostEqual(int8_hist.min, int8.min())
+
+    def test_add_scalars_bulk_empty(self):
+        with CompressionWriter(self.logdir) as writer:
+            writer._add_scalars_bulk([], 0)
+        self.assertEqual(_scalars(self.logdir), {})
+
+    def test_sync_writer_serialized_scalars(self):
+        with _SyncCompressionWriter(self.logdir) as writer:
+            writer._add_scalars_bulk([('alexnet/a', 0.5), ('alexnet/big', 1e40)], 7, 123.0)
+            writer._add_scalars_bulk([('alexnet/a', -2)], 8)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual([(s.step, s.value) for s in acc.Scalars('alexnet/a')], [(7, 0.5), (8, -2.0)])
+        self.assertEqual(acc.Scalars('alexnet/a')[0].wall_time, 123.0)
+        self.assertEqual(acc.Scalars('alexnet/big')[0].value, float('inf'))
+
+    def test_sync_writer_released_after_close(self):
+        writer = _SyncCompressionWriter(self.logdir)
+        event_writer = weakref.ref(writer.file_writer.event_writer)
+        writer.close()
+        del writer
+        gc.collect()
+        # The atexit hook no longer holds the closed event file.
+        self.assertIsNone(event_writer())
+
+    def test_sync_writer_purge_step(self):
+        with _SyncCompressionWriter(self.logdir, filename_suffix='.a') as writer:
+            for step in range(1, 6):
+                writer._add_scalars_bulk([('alexnet/a', step)], step)
+        with _SyncCompressionWriter(self.logdir, purge_step=3, filename_suffix='.b') as writer:
+            writer._add_scalars_bulk([('alexnet/a', 9)], 3)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual([(s.step, s.value) for s in acc.Scalars('alexnet/a')], [(1, 1.0), (2, 2.0), (3, 9.0)])
+
+    def test_sync_writer_write_to_disk(self):
+        logdir = os.path.join(self.logdir, 'unused')
+        with _SyncCompressionWriter(logdir, write_to_disk=False) as writer:
+            writer._add_scalars_bulk([('alexnet/a', 0.5)], 0)
+        self.assertFalse(os.path.exists(logdir))
+
+
+class BenchmarkParserTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.tmpdir, 'benchmark.json')
+        with open(self.json_path, 'w') as f:
+            json.dump({
+                'alexnet': {'fp32': FP32, 'int8': INT8, 'model_info': {'library': 'torchvision'}},
+                'incomplete': {'fp32': FP32},
+            }, f)
+        self.logdir = os.path.join(self.tmpdir, 'runs')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_log_benchmark_results(self):
+        BenchmarkParser().log_benchmark_results(self.json_path, logdir=self.logdir)
+        self.assertEqual(os.listdir(self.logdir), ['alexnet'])
+        scalars = _scalars(os.path.join(self.logdir, 'alexnet'))
+        self.assertAlmostEqual(scalars['alexnet/compression/speedup'].value, 4.0)
+        self.assertAlmostEqual(scalars['alexnet/metrics/sensitivity/int8'].value, 0.65, places=5)
+        self.assertEqual(scalars['alexnet/metadata/device_gpu'].value, 1)
+        session = event_accumulator.EventAccumulator(os.path.join(self.logdir + '_hparams', 'alexnet'))
+        session.Reload()
+        self.assertEqual(sorted(session.PluginTagToContent('hparams')), [
+            '_hparams_/experiment', '_hparams_/session_end_info', '_hparams_/session_start_info',
+        ])
+        self.assertAlmostEqual(session.Scalars('hparam/speedup')[-1].value, 4.0)
+
+    def test_log_benchmark_results_many_models(self):
+        names = [f'model{i}' for i in range(10)]
+        with open(self.json_path, 'w') as f:
+            json.dump({name: {'fp32': FP32, 'int8': INT8} for name in names}, f)
+        BenchmarkParser().log_benchmark_results(self.json_path, logdir=self.logdir)
+        self.assertEqual(sorted(os.listdir(self.logdir)), names)
+        self.assertEqual(sorted(os.listdir(self.logdir + '_hparams')), names)
+        for name in names:
+            scalars = _scalars(os.path.join(self.logdir, name))
+            self.assertAlmostEqual(scalars[name + '/compression/speedup'].value, 4.0)
+
+    def test_log_benchmark_results_returns_fresh_empty_writer(self):
+        with open(self.json_path, 'w') as f:
+            json.dump({'incomplete': {'fp32': FP32}}, f)
+        parser = BenchmarkParser()
+        # The caller owns, and closes, the writer of a file without models.
+        log = parser.log_benchmark_results
+        with log(self.json_path, logdir=self.logdir) as first, log(self.json_path, logdir=self.logdir) as second:
+            self.assertIsNot(first, second)
+        self.assertIsNone(first.file_writer)
+
+    def test_load_nan(self):
+        path = os.path.join(self.tmpdir, 'nan.json')
+        with open(path, 'w') as f:
+            json.dump({'alexnet': {'fp32': {'accuracy': float('nan')}}}, f)
+        data = BenchmarkParser().load_benchmark_json(path)
+        self.assertTrue(math.isnan(data['alexnet']['fp32']['accuracy']))
+
+    def test_iter_benchmark_models(self):
+        models = dict(BenchmarkParser().iter_benchmark_models(self.json_path))
+        self.assertEqual(sorted(models), ['alexnet', 'incomplete'])
+        self.assertEqual(models['alexnet']['int8'], INT8)
+
+    def test_iter_benchmark_models_nan(self):
+        path = os.path.join(self.tmpdir, 'nan.json')
+        with open(path, 'w') as f:
+            json.dump({'alexnet': {'fp32': FP32}, 'resnet18': {'fp32': {'accuracy': float('nan')}}}, f)
+        models = dict(BenchmarkParser().iter_benchmark_models(path))
+        self.assertEqual(models['alexnet']['fp32'], FP32)
+        self.assertTrue(math.isnan(models['resnet18']['fp32']['accuracy']))
+
+    def test_hparam_metrics(self):
+        metrics = _hparam_metrics(FP32, dict(INT8, model_size_mb=0, energy_consumption_mw='n/a'))
+        self.assertEqual(sorted(metrics), [
+            'hparam/accuracy_drop', 'hparam/accuracy_fp32', 'hparam/accuracy_int8',
+            'hparam/memory_reduction_mb', 'hparam/speedup',
+        ])
+        self.assertAlmostEqual(metrics['hparam/speedup'], 4.0)
+        self.assertEqual(_hparam_metrics({}, {}), {})
+
+    def test_not_a_json_object(self):
+        path = os.path.join(self.tmpdir, 'list.json')
+        with open(path, 'w') as f:
+            f.write('  [1, 2]')
+        with self.assertRaises(ValueError):
+            BenchmarkParser().load_benchmark_json(path)
+        with self.assertRaises(ValueError):
+            BenchmarkParser().iter_benchmark_models(path)
+        # Whitespace longer than the read buffer does not hide the list
+        with open(path, 'w') as f:
+            f.write(' ' * 20000 + '[1, 2]')
+        with self.assertRaises(ValueError):
+            BenchmarkParser().load_benchmark_json(path)
+
+    def test_bom_and_leading_whitespace(self):
+        path = os.path.join(self.tmpdir, 'bom.json')
+        with open(path, 'w', encoding='utf-8-sig') as f:
+            f.write('\n' * 20000)
+            json.dump({'alexnet': {'fp32': FP32}}, f)
+        self.assertEqual(BenchmarkParser().load_benchmark_json(path), {'alexnet': {'fp32': FP32}})
+        models = dict(BenchmarkParser().iter_benchmark_models(path))
+        self.assertEqual(models['alexnet']['fp32'], FP32)
+
+    def test_missing_file(self):
+        missing = os.path.join(self.tmpdir, 'missing.json')
+        with self.assertRaises(FileNotFoundError):
+            BenchmarkParser().load_benchmark_json(missing)
+        with self.assertRaises(FileNotFoundError):
+            BenchmarkParser().iter_benchmark_models(missing)
+
+
+class TrainingLoggerTest(unittest.TestCase):
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir)
+
+    def test_log_epoch(self):
+        with TrainingLogger('alexnet', logdir=self.logdir) as logger:
+            logger.log_epoch(0, 0.9, 0.6, 0.55, 1.0, 0.5, 0.45, learning_rate=0.1)
+            logger.log_epoch(1, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65, val_sensitivity=0.6)
+        scalars = _scalars(self.logdir)
+        self.assertAlmostEqual(scalars['alexnet/training/loss'].value, 0.5)
+        self.assertAlmostEqual(scalars['alexnet/validation/f1_score'].value, 0.65, places=5)
+        self.assertEqual(scalars['alexnet/validation/sensitivity'].step, 1)
+        self.assertEqual(scalars['alexnet/training/learning_rate'].step, 0)
+        self.assertNotIn('alexnet/training/sensitivity', scalars)
+        self.assertAlmostEqual(scalars['alexnet/loss/val'].value, 0.7, places=5)
+        # No per-sub-tag runs from add_scalars
+        self.assertEqual([f for f in os.listdir(self.logdir) if os.path.isdir(os.path.join(self.logdir, f))], [])
+        self.assertEqual((logger.best_epoch, logger.best_val_f1), (1, 0.65))
+        self.assertIsNone(logger._thread)
+
+    def test_writer_created_lazily(self):
+        logdir = os.path.join(self.logdir, 'lazy')
+        logger = TrainingLogger('alexnet', logdir=logdir)
+        self.assertIsNone(logger._thread)
+        logger.close()
+        self.assertFalse(os.path.exists(logdir))
+        with TrainingLogger('alexnet', logdir=logdir) as logger:
+            logger.log_epoch(0, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)
+        self.assertIn('alexnet/training/loss', _scalars(logdir))
+
+    def test_written_at_exit_without_close(self):
+        self.assertEqual(_run_without_close(self.logdir, 1, 50), list(range(50)))
+
+    def test_log_every_tail_written_at_exit(self):
+        self.assertEqual(_run_without_close(self.logdir, 4, 6), list(range(6)))
+
+    def test_write_error_raised(self):
+        class FailingWriter(CompressionWriter):
+            def _add_scalars_bulk(self, scalars, global_step, walltime):
+                raise OSError('disk full')
+
+        logger = TrainingLogger('alexnet', logdir=self.logdir)
+        logger.writer = FailingWriter(self.logdir)
+        with self.assertLogs('tensorboardX.compression.training', 'ERROR'):
+            logger.log_epoch(0, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)
+            with self.assertRaisesRegex(OSError, 'disk full'):
+                logger.close()
+        # Raised once; the writer is still closed
+        logger.close()
+
+    def test_set_writer(self):
+        logger = TrainingLogger('alexnet', logdir=self.logdir)
+        logger.log_epoch(0, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)
+        logdir = os.path.join(self.logdir, 'other')
+        logger.writer = CompressionWriter(logdir)
+        logger.log_epoch(1, 0.4, 0.8, 0.75, 0.7, 0.7, 0.65)
+        logger.close()
+        self.assertEqual(_scalars(logdir)['alexnet/training/loss'].step, 1)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual([s.step for s in acc.Scalars('alexnet/training/loss')], [0])
+
+    def test_log_every(self):
+        logger = TrainingLogger('alexnet', logdir=self.logdir, log_every=3)
+        for epoch in range(4):
+            logger.log_epoch(epoch, 0.5, 0.8, 0.75, 0.7, 0.7, 0.1 * epoch)
+        self.assertEqual([item[0] for item in logger._buffer], [3])
+        # Written epochs reach the file without waiting for close()
+        logger._queue.join()
+        self.assertEqual(_scalars(self.logdir)['alexnet/training/loss'].step, 2)
+        self.assertEqual(logger.best_epoch, 3)
+        logger.close()
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual([s.step for s in acc.Scalars('alexnet/validation/f1_score')], [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            TrainingLogger('alexnet', logdir=self.logdir, log_every=0)
+
+    def test_log_epochs_batch(self):
+        val_f1 = np.array([0.2, 0.6, float('nan'), 0.6, 0.4])
+        with TrainingLogger('alexnet', logdir=self.logdir) as logger:
+            logger.log_epochs_batch(
+                np.arange(5), np.linspace(1, 0.5, 5), np.full(5, 0.8), np.full(5, 0.7),
+                np.full(5, 0.9), np.full(5, 0.75), val_f1, learning_rate=[0.1] * 5)
+            self.assertEqual((logger.best_epoch, logger.best_val_f1), (1, 0.6))
+            with self.assertRaises(ValueError):
+                logger.log_epochs_batch([5, 6], [1.0], [1.0], [1.0], [1.0], [1.0], [1.0])
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        losses = acc.Scalars('alexnet/training/loss')
+        self.assertEqual([s.step for s in losses], [0, 1, 2, 3, 4])
+        self.assertAlmostEqual(losses[-1].value, 0.5)
+        self.assertEqual(len(acc.Scalars('alexnet/training/learning_rate')), 5)
+
+    def test_best_index(self):
+        self.assertEqual(_best_index([0.2, float('nan'), 0.5, 0.5]), (0.5, 2))
+        self.assertEqual(_best_index([float('nan')]), (float('-inf'), -1))
+        self.assertEqual(_best_index([]), (float('-inf'), -1))
+
+    def test_log_training_summary(self):
+        with TrainingLogger('alexnet', logdir=self.logdir) as logger:
+            logger.log_epoch(0, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)
+            logger.log_training_summary(1, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertNotIn('alexnet/validation/final_val_f1', acc.Tags()['scalars'])
+        self.assertEqual(sorted(acc.PluginTagToContent('hparams')), [
+            '_hparams_/experiment', '_hparams_/session_end_info', '_hparams_/session_start_info',
+        ])
+
+    def test_log_training_summary_final_scalars(self):
+        with TrainingLogger('alexnet', logdir=self.logdir) as logger:
+            logger.log_training_summary(
+                1, 0.5, 0.8, 0.75, 0.7, 0.7, 0.65, emit_final_scalars=True)
+        final_f1 = _scalars(self.logdir)['alexnet/validation/final_val_f1']
+        self.assertEqual(final_f1.step, 2)
+        self.assertAlmostEqual(final_f1.value, 0.65, places=5)
+
+    def test_skip_unchanged(self):
+        with TrainingLogger('alexnet', logdir=self.logdir,
+                            unchanged_tolerance=1e-6, force_write_every=3) as logger:
+            for epoch in range(7):
+                logger.log_epoch(epoch, 1.0 / (epoch + 1), 0.8, 0.75, 0.7, 0.7, 0.65)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual(len(acc.Scalars('alexnet/training/loss')), 7)
+        self.assertEqual([s.step for s in acc.Scalars('alexnet/validation/loss')], [0, 3, 6])
+
+    def test_log_early_stopping(self):
+        with TrainingLogger('alexnet', logdir=self.logdir) as logger:
+            logger.log_early_stopping(0, patience=5, min_delta=0.01, stopped=False)
+            logger.log_early_stopping(1, patience=5, min_delta=0.01, stopped=True)
+        acc = event_accumulator.EventAccumulator(self.logdir)
+        acc.Reload()
+        self.assertEqual([s.step for s in acc.Scalars('alexnet/training/early_stopping_patience')], [0])
+        self.assertEqual([s.value for s in acc.Scalars('alexnet/training/early_stopped')], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,258 @@
+import gzip
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from tensorboard import context as tb_context
+from tensorboard.backend.event_processing import data_provider as tb_data_provider
+from tensorboard.backend.event_processing import (
+    event_multiplexer,
+    plugin_event_multiplexer,
+)
+from tensorboard.plugins import base_plugin
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+from compression_board_plugin.compression_board_plugin.compression_plugin import (
+    CompressionPlugin,
+)
+from tensorboardX import SummaryWriter
+
+
+def _write_run(logdir, model_name, with_compression=True):
+    with SummaryWriter(f'{logdir}/{model_name}') as w:
+        w.add_scalar(f'{model_name}/metrics/accuracy/fp32', 0.8, 0)
+        w.add_scalar(f'{model_name}/metrics/accuracy/fp32', 0.9, 1)
+        w.add_scalar(f'{model_name}/metrics/accuracy/int8', 0.85, 0)
+        w.add_scalar(f'{model_name}/performance/latency_ms/fp32', 8.0, 0)
+        w.add_scalar(f'{model_name}/performance/latency_ms/int8', 2.0, 0)
+        # Legacy tag name, resolved through the fallback chain.
+        w.add_scalar(f'{model_name}/performance/energy/fp32', 5.0, 0)
+        if with_compression:
+            w.add_scalar(f'{model_name}/compression/speedup', 4.0, 0)
+            w.add_scalar(f'{model_name}/compression/size_ratio', 3.5, 0)
+
+
+class CompressionPluginTest(unittest.TestCase):
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+        _write_run(self.logdir, 'alexnet')
+        _write_run(self.logdir, 'resnet18')
+        _write_run(self.logdir, 'plain', with_compression=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir)
+
+    def _plugin(self, use_data_provider):
+        if use_data_provider:
+            # The data provider needs the tensor-based plugin multiplexer.
+            multiplexer = plugin_event_multiplexer.EventMultiplexer()
+            multiplexer.AddRunsFromDirectory(self.logdir)
+            multiplexer.Reload()
+            provider = tb_data_provider.MultiplexerDataProvider(multiplexer, self.logdir)
+            context = base_plugin.TBContext(logdir=self.logdir, data_provider=provider)
+        else:
+            multiplexer = event_multiplexer.EventMultiplexer()
+            multiplexer.AddRunsFromDirectory(self.logdir)
+            multiplexer.Reload()
+            context = base_plugin.TBContext(logdir=self.logdir, multiplexer=multiplexer)
+        plugin = CompressionPlugin(context)
+        self.addCleanup(plugin.close)
+        return plugin
+
+    def _get(self, plugin, route, headers=None):
+        app = plugin.get_plugin_apps()[route]
+        environ = EnvironBuilder(path=route, headers=headers).get_environ()
+        body, status, response_headers = run_wsgi_app(app, environ, buffered=True)
+        return b''.join(body), status, response_headers
+
+    def _get_summary(self, plugin, headers=None):
+        # A cold request answers 202 until the first snapshot is built.
+        for _ in range(200):
+            body, status, response_headers = self._get(plugin, '/api/summary', headers)
+            if not status.startswith('202'):
+                break
+            time.sleep(0.05)
+        return body, status, response_headers
+
+    def _check_summary(self, plugin):
+        body, status, headers = self._get_summary(plugin)
+        self.assertTrue(status.startswith('200'))
+        self.assertIn('ETag', headers)
+        runs = {r['run']: r for r in json.loads(body)['runs']}
+        self.assertEqual(sorted(runs), ['alexnet', 'resnet18'])
+        self.assertAlmostEqual(runs['alexnet']['speedup'], 4.0)
+        self.assertAlmostEqual(runs['alexnet']['accuracy_fp32'], 0.9)
+        self.assertAlmostEqual(runs['alexnet']['latency_int8'], 2.0)
+        self.assertAlmostEqual(runs['alexnet']['energy_fp32'], 5.0)
+        self.assertIsNone(runs['alexnet']['energy_int8'])
+        self.assertEqual(runs['alexnet']['speedup_fmt'], '4.00x')
+        self.assertEqual(runs['alexnet']['accuracy_fp32_fmt'], '0.9000')
+        self.assertNotIn('energy_int8_fmt', runs['alexnet'])
+
+    def test_summary_gzip(self):
+        plugin = self._plugin(use_data_provider=False)
+        plain, _, _ = self._get_summary(plugin)
+        body, _, headers = self._get_summary(plugin, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(body), plain)
+
+    def test_summary_multiplexer(self):
+        self._check_summary(self._plugin(use_data_provider=False))
+
+    def test_summary_data_provider(self):
+        self._check_summary(self._plugin(use_data_provider=True))
+
+    def test_summary_etag(self):
+        plugin = self._plugin(use_data_provider=False)
+        _, _, headers = self._get_summary(plugin)
+        body, status, _ = self._get_summary(plugin, headers={'If-None-Match': headers['ETag']})
+        self.assertTrue(status.startswith('304'))
+        self.assertEqual(body, b'')
+
+    def test_summary_unavailable_while_building(self):
+        plugin = self._plugin(use_data_provider=False)
+        release = threading.Event()
+        build_summary = plugin._build_summary
+
+        def slow_build_summary(*args):
+            release.wait()
+            return build_summary(*args)
+
+        plugin._build_summary = slow_build_summary
+        try:
+            _, status, headers = self._get(plugin, '/api/summary')
+            self.assertTrue(status.startswith('202'))
+            self.assertIn('Retry-After', headers)
+        finally:
+            release.set()
+        _, status, _ = self._get_summary(plugin)
+        self.assertTrue(status.startswith('200'))
+
+    def test_close_stops_refresher(self):
+        plugin = self._plugin(use_data_provider=False)
+        self.assertIsNone(plugin._summary_thread)
+        self._get_summary(plugin)
+        thread = plugin._summary_thread
+        self.assertTrue(thread.is_alive())
+        plugin.close()
+        self.assertFalse(thread.is_alive())
+
+    def test_static_etag(self):
+        plugin = self._plugin(use_data_provider=False)
+        for route in ('/', '/render.js'):
+            body, status, headers = self._get(plugin, route)
+            self.assertTrue(status.startswith('200'))
+            self.assertTrue(body)
+            etag = headers['ETag']
+            body, status, _ = self._get(plugin, route, headers={'If-None-Match': etag})
+            self.assertTrue(status.startswith('304'))
+            self.assertEqual(body, b'')
+
+    def test_render_module_gzip(self):
+        plugin = self._plugin(use_data_provider=False)
+        plain, _, headers = self._get(plugin, '/render.js')
+        self.assertNotIn('Content-Encoding', headers)
+        body, _, headers = self._get(plugin, '/render.js', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(body), plain)
+
+    def test_is_active(self):
+        plugin = self._plugin(use_data_provider=False)
+        # Reported active until the background probe has finished.
+        self.assertTrue(plugin.is_active())
+        self.assertTrue(plugin._has_compression_data())
+
+    def test_is_active_without_compression_runs(self):
+        logdir = tempfile.mkdtemp()
+        try:
+            _write_run(logdir, 'plain', with_compression=False)
+            multiplexer = event_multiplexer.EventMultiplexer()
+            multiplexer.AddRunsFromDirectory(logdir)
+            multiplexer.Reload()
+            plugin = CompressionPlugin(base_plugin.TBContext(logdir=logdir, multiplexer=multiplexer))
+            self.addCleanup(plugin.close)
+            self.assertFalse(plugin._has_compression_data())
+            # The refresher thread probes on the first is_active call.
+            self.assertTrue(plugin.is_active())
+            for _ in range(200):
+                if not plugin.is_active():
+                    break
+                time.sleep(0.05)
+            self.assertFalse(plugin.is_active())
+        finally:
+            shutil.rmtree(logdir)
+
+    def test_refresher_survives_errors(self):
+        plugin = self._plugin(use_data_provider=False)
+        failed = threading.Event()
+
+        def failing_refresh():
+            failed.set()
+            raise RuntimeError('boom')
+
+        plugin._refresh_summaries = failing_refresh
+        with self.assertLogs('compression_board_plugin', level='ERROR') as logs:
+            plugin.is_active()
+            self.assertTrue(failed.wait(5))
+            for _ in range(100):
+                if logs.records:
+                    break
+                time.sleep(0.05)
+        self.assertTrue(plugin._summary_thread.is_alive())
+
+    def test_compression_runs_cached_per_tag_filter(self):
+        plugin = self._plugin(use_data_provider=False)
+        # Same tag count for both filters; only the tag lists differ.
+        summary_tags = {'a': ['a/compression/speedup']}
+        all_tags = {'a': ['a/loss']}
+        self.assertEqual(plugin._compression_runs(summary_tags, 'summary'), ['a'])
+        self.assertEqual(plugin._compression_runs(all_tags), [])
+        self.assertEqual(plugin._compression_runs(summary_tags, 'summary'), ['a'])
+
+    def test_summary_skips_rebuild_when_unchanged(self):
+        ctx = tb_context.RequestContext()
+        for use_data_provider in (False, True):
+            plugin = self._plugin(use_data_provider)
+            version, body = plugin._build_summary(ctx, '')
+            self.assertIsNotNone(version)
+            self.assertIsNotNone(body)
+            self.assertEqual(plugin._build_summary(ctx, '', version), (version, None))
+
+    def test_summary_token_does_not_read_scalars(self):
+        ctx = tb_context.RequestContext()
+        plugin = self._plugin(use_data_provider=False)
+        version, _ = plugin._build_summary(ctx, '')
+        multiplexer = plugin._context.multiplexer
+        # Reloading without new events keeps the token.
+        multiplexer.Reload()
+        for run_name in multiplexer.Runs():
+            accumulator = multiplexer.GetAccumulator(run_name)
+            accumulator.Scalars = unittest.mock.Mock(side_effect=AssertionError('read'))
+        self.assertEqual(plugin._build_summary(ctx, '', version), (version, None))
+
+    def test_summary_rereads_only_changed_runs(self):
+        ctx = tb_context.RequestContext()
+        for use_data_provider in (False, True):
+            plugin = self._plugin(use_data_provider)
+            version, body = plugin._build_summary(ctx, '')
+            cached = plugin._summary_row_cache['']
+            before = {run: entry[1] for run, entry in cached.items()}
+            # A distinct suffix keeps the new event file from replacing the old one.
+            with SummaryWriter(f'{self.logdir}/alexnet', filename_suffix=f'.{use_data_provider}') as w:
+                w.add_scalar('alexnet/compression/speedup', 5.0, 1)
+            multiplexer = plugin._context.multiplexer or plugin._context.data_provider._multiplexer
+            multiplexer.Reload()
+            _, body = plugin._build_summary(ctx, '', version)
+            runs = {r['run']: r for r in json.loads(body)['runs']}
+            self.assertAlmostEqual(runs['alexnet']['speedup'], 5.0)
+            after = plugin._summary_row_cache['']
+            self.assertIsNot(after['alexnet'][1], before['alexnet'])
+            self.assertIs(after['resnet18'][1], before['resnet18'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 import torch
 import boto3
@@ -67,6 +70,12 @@ class EmbeddingTest(unittest.TestCase):
                             global_step=2)
     @mock_s3
     def test_embedding_s3_mock(self):
+        # The projector files of an s3:// logdir land in a local "s3:"
+        # directory; keep it out of the working tree.
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmpdir)
         client = boto3.client('s3', region_name='us-east-1')
         client.create_bucket(Bucket='this')
         w = SummaryWriter("s3://this/is/apen")